@@ -6,12 +6,34 @@
 
 # constants
 DEBUG = False        # debug mode?
-RPi = True           # is this running on the RPi?
+RPi = True           # is this running on the RPi? (if not, the components are simulated)
 ANIMATE = True       # animate the LCD text?
 SHOW_BUTTONS = False # show the Pause and Quit buttons on the main LCD GUI?
 COUNTDOWN = 120      # the initial bomb countdown value (seconds)
 NUM_STRIKES = 5      # the total strikes allowed before the bomb "explodes"
 NUM_PHASES = 4       # the total number of initial active bomb phases
+DEBOUNCE = 0.02      # the default debounce window of the jumper wires and toggle switches (seconds)
+WIRES_DEBOUNCE = [ DEBOUNCE ] * 5      # the debounce window of each jumper wire pin (seconds)
+TOGGLES_DEBOUNCE = [ DEBOUNCE ] * 4    # the debounce window of each toggle switch pin (seconds)
+EDGE_SAMPLE_INTERVAL = 0.02 # how often pins are sampled (by a single thread) when edge detection isn't available (seconds)
+KEYPAD_SCAN_RATE = 1000 # how often the keypad matrix is scanned while keys are being pressed (Hz)
+KEYPAD_IDLE_SCAN_RATE = 100 # how often the keypad matrix is scanned when it is idle (Hz; only if its key presses can't be watched)
+KEYPAD_DEBOUNCE = 0.01 # the debounce window of each key (seconds)
+KEYPAD_BUFFER = 256  # the number of key presses/releases that are buffered until the keypad phase consumes them
+KEYPAD_RATE_WINDOW = 16 # the number of recent key presses that the typing rate (keys/sec) is measured over
+RUNTIME = "scanner"  # how the phases run: "scanner" (a single thread), "threads" (one thread per phase), or "asyncio"
+POLL_FAST = 0.01     # how often a phase is polled right after it changes (seconds)
+POLL_SLOW = 0.1      # how often an idle phase is polled (seconds; the longest it can take to notice an unwatched change)
+POLL_WATCHED = 1.0   # how often an idle phase whose inputs are watched is polled (seconds; a change wakes the runtime right away)
+POLL_HOLD = 1.0      # how long a phase keeps being polled at the fast rate after it changes (seconds)
+POLL_BACKOFF = 1.5   # how much longer each poll of an idle phase waits than the last one
+TK_FRAME_INTERVAL = 1 / 60 # how often the GUI is updated by the asyncio runtime (seconds)
+FRAME_INTERVAL = 16  # the GUI's frame interval (ms) when it waits for something to finish
+STARTUP_REPORT = False # print where the startup time goes?
+TRACE = False        # trace the latency from the inputs to the GUI? (the histograms are printed when the game ends)
+TRACE_PORT = 8102    # the local port that the latency histograms are served from when tracing (None -> not served)
+PUZZLE_BANK = None   # the puzzle bank to boot from (None -> generate a new puzzle; build one with OurPuzzleBank.py)
+PUZZLE_SEED = None   # the puzzle (seed) in the bank to boot from (None -> a random puzzle from the bank)
 # the various image and audio files
 EXPLODE = [ "explosion11.png", "fart.mp3" ]
 SUCCESS = [ "success.png", "congratulations.mp3" ]
@@ -19,77 +41,146 @@ STRIKE = "wrong.mp3"
 EXPLODING = "10sec.mp3"
 DEFUSED = "bombdefused.mp3"
 TICK = "ticking.mp3"
+# the audio files that are decoded at boot
+SOUNDS = [ TICK, EXPLODING, STRIKE, DEFUSED, EXPLODE[1], SUCCESS[1] ]
+AUDIO_BUFFER = 512   # the audio buffer size (samples; smaller buffers start playing sooner)
 
 # imports
-from random import randint, shuffle, choice
+from random import randint, randrange, shuffle, choice, choices
 from string import ascii_uppercase
-if (RPi):
-    import board
-    from adafruit_ht16k33.segments import Seg7x4
-    from digitalio import DigitalInOut, Direction, Pull
-    from adafruit_matrixkeypad import Matrix_Keypad
+from math import ceil
+
+# the serial number tables (precomputed, so that generating a serial number never has to retry)
+#  DIGIT_SUMS[n][s]: the number of ways that n digits (0..9) can add up to s
+DIGIT_SUMS = [ [ 1 ] + [ 0 ] * 36 ]
+for _n in range(4):
+    DIGIT_SUMS.append([ sum(DIGIT_SUMS[_n][s - d] for d in range(min(9, s) + 1)) for s in range(37) ])
+# the toggle switch targets (exactly 3 of the 4 are set)
+TOGGLES_TARGETS = [ n for n in range(16) if bin(n).count("1") == 3 ]
+# the final letter of a serial number (F..Z)
+SERIAL_LAST_LETTERS = ascii_uppercase[5:]
+
+# the keypad tables (built once, so that a combination is a couple of str.translate() calls)
+#  ROT_TABLES[rot]: encrypts a keyword using a rotation cipher (rot 0..25)
+ROT_TABLES = [ str.maketrans(ascii_uppercase, ascii_uppercase[rot:] + ascii_uppercase[:rot]) for rot in range(26) ]
+# the letters on each key of the keypad (Q and Z aren't on the keypad)
+KEYPAD_LETTERS = [ None, None, "ABC", "DEF", "GHI", "JKL", "MNO", "PRS", "TUV", "WXY" ]
+# maps each letter of a passphrase to its keypad digit (letters that aren't on the keypad are dropped)
+KEYPAD_TABLE = str.maketrans("".join(k for k in KEYPAD_LETTERS if k), "".join(str(i) * len(k) for i, k in enumerate(KEYPAD_LETTERS) if k), "QZ")
+# the rows of the bootup text's lookup table (the letters and their positions, mod 10)
+BOOT_LETTERS = " ".join(ascii_uppercase)
+BOOT_DIGITS = " ".join([ str(n % 10) for n in range(26) ])
+# the keywords (for the keypad lookup table) and matching passphrases
+KEYWORDS = { "BADGER": "RIVER",\
+             "BANDIT": "FADED",\
+             "CABLES": "SPINY",\
+             "CANOPY": "THROW",\
+             "FIELDS": "CYCLE",\
+             "FIERCE": "ALOOF",\
+             "IMMUNE": "STOLE",\
+             "IMPACT": "TOADY",\
+             "MIDWAY": "FEIGN",\
+             "MIGHTY": "CARVE",\
+             "REBORN": "TRICK",\
+             "RECALL": "CLIMB",\
+             "SYMBOL": "LEAVE",\
+             "SYSTEM": "FOXES",\
+             "WIDELY": "BOUND",\
+             "WINGED": "YACHT" }
 
 #################################
 # setup the electronic components
 #################################
-# 7-segment display
-# 4 pins: 5V(+), GND(-), SDA, SCL
-#         ----------7SEG---------
-if (RPi):
-    i2c = board.I2C()
-    component_7seg = Seg7x4(i2c)
+# sets up the electronic components (the hardware libraries are only imported and initialized when this is called, so
+#  that the GUI can appear first)
+# returns the components: 7-segment display, keypad, jumper wires, pushbutton state, pushbutton RGB, toggle switches
+def setupComponents():
+    global component_7seg, component_keypad, component_wires, component_button_state, component_button_RGB, component_toggles
+
+    # imports
+    if (RPi):
+        import board
+        from adafruit_ht16k33.segments import Seg7x4
+        from digitalio import DigitalInOut, Direction, Pull
+        from adafruit_matrixkeypad import Matrix_Keypad
+    # off the RPi, the components are simulated in memory
+    else:
+        from OurSim import FakePin, FakeKeypad, FakeSeg7x4
+    from OurDisplay import SegmentDisplay
+
+    # 7-segment display
+    # 4 pins: 5V(+), GND(-), SDA, SCL
+    #         ----------7SEG---------
+    if (RPi):
+        i2c = board.I2C()
+        # the display is wrapped so that unchanged values aren't rewritten and changes are written in one transaction
+        component_7seg = SegmentDisplay(Seg7x4(i2c))
+    else:
+        component_7seg = SegmentDisplay(FakeSeg7x4())
     # set the 7-segment display brightness (0 -> dimmest; 1 -> brightest)
     component_7seg.brightness = 0.5
 
-# keypad
-# 8 pins: 10, 9, 11, 5, 6, 13, 19, NA
-#         -----------KEYPAD----------
-if (RPi):
-    # the pins
-    keypad_cols = [DigitalInOut(i) for i in (board.D10, board.D9, board.D11)]
-    keypad_rows = [DigitalInOut(i) for i in (board.D5, board.D6, board.D13, board.D19)]
-    # the keys
-    keypad_keys = ((1, 2, 3), (4, 5, 6), (7, 8, 9), ("*", 0, "#"))
-
-    component_keypad = Matrix_Keypad(keypad_rows, keypad_cols, keypad_keys)
-
-# jumper wires
-# 10 pins: 14, 15, 18, 23, 24, 3V3, 3V3, 3V3, 3V3, 3V3
-#          -------JUMP1------  ---------JUMP2---------
-# the jumper wire pins
-if (RPi):
-    # the pins
-    component_wires = [DigitalInOut(i) for i in (board.D14, board.D15, board.D18, board.D23, board.D24)]
-    for pin in component_wires:
-        # pins are input and pulled down
-        pin.direction = Direction.INPUT
-        pin.pull = Pull.DOWN
-
-# pushbutton
-# 6 pins: 4, 17, 27, 22, 3V3, 3V3
-#         -BUT1- -BUT2-  --BUT3--
-if (RPi):
-    # the state pin (state pin is input and pulled down)
-    component_button_state = DigitalInOut(board.D4)
-    component_button_state.direction = Direction.INPUT
-    component_button_state.pull = Pull.DOWN
-    # the RGB pins
-    component_button_RGB = [DigitalInOut(i) for i in (board.D17, board.D27, board.D22)]
-    for pin in component_button_RGB:
-        # RGB pins are output
-        pin.direction = Direction.OUTPUT
-        pin.value = True
-
-# toggle switches
-# 3x3 pins: 12, 16, 20, 21, 3V3, 3V3, 3V3, 3V3, GND, GND, GND, GND
-#           -TOG1-  -TOG2-  --TOG3--  --TOG4--  --TOG5--  --TOG6--
-if (RPi):
-    # the pins
-    component_toggles = [DigitalInOut(i) for i in (board.D12, board.D16, board.D20, board.D21)]
-    for pin in component_toggles:
-        # pins are input and pulled down
-        pin.direction = Direction.INPUT
-        pin.pull = Pull.DOWN
+    # keypad
+    # 8 pins: 10, 9, 11, 5, 6, 13, 19, NA
+    #         -----------KEYPAD----------
+    if (RPi):
+        # the pins
+        keypad_cols = [DigitalInOut(i) for i in (board.D10, board.D9, board.D11)]
+        keypad_rows = [DigitalInOut(i) for i in (board.D5, board.D6, board.D13, board.D19)]
+        # the keys
+        keypad_keys = ((1, 2, 3), (4, 5, 6), (7, 8, 9), ("*", 0, "#"))
+
+        component_keypad = Matrix_Keypad(keypad_rows, keypad_cols, keypad_keys)
+    else:
+        component_keypad = FakeKeypad()
+
+    # jumper wires
+    # 10 pins: 14, 15, 18, 23, 24, 3V3, 3V3, 3V3, 3V3, 3V3
+    #          -------JUMP1------  ---------JUMP2---------
+    # the jumper wire pins
+    if (RPi):
+        # the pins
+        component_wires = [DigitalInOut(i) for i in (board.D14, board.D15, board.D18, board.D23, board.D24)]
+        for pin in component_wires:
+            # pins are input and pulled down
+            pin.direction = Direction.INPUT
+            pin.pull = Pull.DOWN
+    else:
+        # the wires start out connected
+        component_wires = [FakePin(True, name) for name in ("D14", "D15", "D18", "D23", "D24")]
+
+    # pushbutton
+    # 6 pins: 4, 17, 27, 22, 3V3, 3V3
+    #         -BUT1- -BUT2-  --BUT3--
+    if (RPi):
+        # the state pin (state pin is input and pulled down)
+        component_button_state = DigitalInOut(board.D4)
+        component_button_state.direction = Direction.INPUT
+        component_button_state.pull = Pull.DOWN
+        # the RGB pins
+        component_button_RGB = [DigitalInOut(i) for i in (board.D17, board.D27, board.D22)]
+        for pin in component_button_RGB:
+            # RGB pins are output
+            pin.direction = Direction.OUTPUT
+            pin.value = True
+    else:
+        component_button_state = FakePin(False, "D4")
+        component_button_RGB = [FakePin(True, name) for name in ("D17", "D27", "D22")]
+
+    # toggle switches
+    # 3x3 pins: 12, 16, 20, 21, 3V3, 3V3, 3V3, 3V3, GND, GND, GND, GND
+    #           -TOG1-  -TOG2-  --TOG3--  --TOG4--  --TOG5--  --TOG6--
+    if (RPi):
+        # the pins
+        component_toggles = [DigitalInOut(i) for i in (board.D12, board.D16, board.D20, board.D21)]
+        for pin in component_toggles:
+            # pins are input and pulled down
+            pin.direction = Direction.INPUT
+            pin.pull = Pull.DOWN
+    else:
+        component_toggles = [FakePin(False, name) for name in ("D12", "D16", "D20", "D21")]
+
+    return component_7seg, component_keypad, component_wires, component_button_state, component_button_RGB, component_toggles
 
 ###########
 # functions
@@ -100,136 +191,144 @@ if (RPi):
 #  the first three letters should be distinct and in the range 0..4 such that A=0, B=1, etc, to match the jumper wires
 #  the last letter should be outside of the range
 def genSerial():
-    # set the digits (used in the toggle switches phase)
-    serial_digits = []
+    # set the digits (used in the jumper wires phase)
     jumper_value = randint(1, 31)
-    # the sum of the digits is the toggle value
-    while (len(serial_digits) < 3 or jumper_value - sum(serial_digits) > 0):
-        d = randint(0, min(9, jumper_value - sum(serial_digits)))
-        serial_digits.append(d)
-
-    # set the letters (used in the jumper wires phase)
-    toggle_indexes = [ 0 ] * 4
-    while (sum(toggle_indexes) < 3):
-        toggle_indexes[randint(0, len(toggle_indexes) - 1)] = 1
-    toggle_value = int("".join([ str(n) for n in toggle_indexes ]), 2)
-    # the letters indicate which jumper wires must be "cut"
-    toggle_letters = [ chr(i + 65) for i, n in enumerate(toggle_indexes) if n == 1 ]
+    # the sum of the digits is the jumper value
+    serial_digits = sampleDigits(jumper_value, serialDigits(jumper_value))
+
+    # set the letters (used in the toggle switches phase)
+    toggle_value = choice(TOGGLES_TARGETS)
+    # the letters indicate which toggle switches must be set (the most significant bit is A)
+    letters = [ chr(i + 65) for i in range(4) if (toggle_value >> (3 - i)) & 1 ]
 
     # form the serial number
-    serial = [ str(d) for d in serial_digits ] + toggle_letters
+    serial = [ str(d) for d in serial_digits ] + letters
     # and shuffle it
     shuffle(serial)
     # finally, add a final letter (F..Z)
-    serial += [ choice([ chr(n) for n in range(70, 91) ]) ]
+    serial += [ choice(SERIAL_LAST_LETTERS) ]
     # and make the serial number a string
     serial = "".join(serial)
 
     return serial, toggle_value, jumper_value
 
+# generates n serial numbers (and their targets) at once, e.g., to pre-generate the puzzles of a whole event
+# returns a list of (serial, toggle_value, jumper_value)
+def genSerials(n):
+    return [ genSerial() for i in range(n) ]
+
+# the number of digits in a serial number whose digits add up to a total (the fewest digits that can, but at least 3)
+def serialDigits(total):
+    return max(3, ceil(total / 9))
+
+# draws digits that add up to a total, uniformly from every sequence of that many digits that does
+# each digit is weighted by the number of ways that the remaining digits can add up to the rest (so there's no retrying)
+def sampleDigits(total, count):
+    digits = []
+    for n in range(count, 0, -1):
+        r = randrange(DIGIT_SUMS[n][total])
+        for d in range(min(9, total) + 1):
+            r -= DIGIT_SUMS[n - 1][total - d]
+            if (r < 0):
+                break
+        digits.append(d)
+        total -= d
+    return digits
+
 # generates the keypad combination from a keyword and rotation key
 def genKeypadCombination():
-    # encrypts a keyword using a rotation cipher
-    def encrypt(keyword, rot):
-        cipher = ""
-
-        # encrypt each letter of the keyword using rot
-        for c in keyword:
-            cipher += chr((ord(c) - 65 + rot) % 26 + 65)
-
-        return cipher
-
-    # returns the keypad digits that correspond to the passphrase
-    def digits(passphrase):
-        combination = ""
-        keys = [ None, None, "ABC", "DEF", "GHI", "JKL", "MNO", "PRS", "TUV", "WXY" ]
-
-        # process each character of the keyword
-        for c in passphrase:
-            for i, k in enumerate(keys):
-                if (k and c in k):
-                    # map each character to its digit equivalent
-                    combination += str(i)
-
-        return combination
-
-    # the list of keywords and matching passphrases
-    keywords = { "BADGER": "RIVER",\
-                 "BANDIT": "FADED",\
-                 "CABLES": "SPINY",\
-                 "CANOPY": "THROW",\
-                 "FIELDS": "CYCLE",\
-                 "FIERCE": "ALOOF",\
-                 "IMMUNE": "STOLE",\
-                 "IMPACT": "TOADY",\
-                 "MIDWAY": "FEIGN",\
-                 "MIGHTY": "CARVE",\
-                 "REBORN": "TRICK",\
-                 "RECALL": "CLIMB",\
-                 "SYMBOL": "LEAVE",\
-                 "SYSTEM": "FOXES",\
-                 "WIDELY": "BOUND",\
-                 "WINGED": "YACHT" }
     # the rotation cipher key
     rot = randint(1, 25)
 
     # pick a keyword and matching passphrase
-    keyword, passphrase = choice(list(keywords.items()))
-    # encrypt the passphrase and get its combination
-    cipher_keyword = encrypt(keyword, rot)
-    combination = digits(passphrase)
+    keyword, passphrase = choice(list(KEYWORDS.items()))
+    # encrypt the keyword and get the passphrase's combination
+    cipher_keyword = keyword.translate(ROT_TABLES[rot])
+    combination = passphrase.translate(KEYPAD_TABLE)
 
     return keyword, cipher_keyword, rot, combination, passphrase
 
+# generates n keypad combinations at once, e.g., to pre-generate the puzzles of a whole event (or to print them)
+# every keyword's combination is only worked out once, and the rotations are looked up in the tables
+# returns a list of (keyword, cipher_keyword, rot, combination, passphrase)
+def genKeypadCombinations(n):
+    keywords = [ (keyword, passphrase, passphrase.translate(KEYPAD_TABLE)) for keyword, passphrase in KEYWORDS.items() ]
+    ciphers = { keyword: [ keyword.translate(table) for table in ROT_TABLES ] for keyword in KEYWORDS }
+    combinations = []
+    for (keyword, passphrase, combination), rot in zip(choices(keywords, k=n), choices(range(1, 26), k=n)):
+        combinations.append((keyword, ciphers[keyword][rot], rot, combination, passphrase))
+    return combinations
+
+# generates the color of the pushbutton (which determines how to defuse the phase) and its target
+def genButton(serial):
+    button_color = choice(["R", "G", "B"])
+    # appropriately set the target (R is None)
+    button_target = None
+    # G is the first numeric digit in the serial number
+    if (button_color == "G"):
+        button_target = [ n for n in serial if n.isdigit() ][0]
+        # modify the wires target (G is to cut wires B and D)
+        #  ABCDE
+        #  10101 = 21
+    # B is the last numeric digit in the serial number
+    elif (button_color == "B"):
+        button_target = [ n for n in serial if n.isdigit() ][-1]
+        # modify the wires target (B is to cut all wires except B, C, and D)
+        #  ABCDE
+        #  01110 = 14
+
+    return button_color, button_target
+
+# generates the bomb's specifics (a new puzzle)
+def genPuzzle():
+    # boot from a pre-generated puzzle (one record of the puzzle bank)
+    if (PUZZLE_BANK):
+        from OurPuzzleBank import loadPuzzle
+        serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target = loadPuzzle(PUZZLE_BANK, PUZZLE_SEED)
+    else:
+        # generate the bomb's serial number (which also gets us the toggle and jumper target values)
+        #  serial: the bomb's serial number
+        #  toggles_target: the toggles phase defuse value
+        #  wires_target: the wires phase defuse value
+        serial, toggles_target, wires_target = genSerial()
+
+        # generate the combination for the keypad phase
+        #  keyword: the plaintext keyword for the lookup table
+        #  cipher_keyword: the encrypted keyword for the lookup table
+        #  rot: the key to decrypt the keyword
+        #  keypad_target: the keypad phase defuse value (combination)
+        #  passphrase: the target plaintext passphrase
+        keyword, cipher_keyword, rot, keypad_target, passphrase = genKeypadCombination()
+
+        # generate the color of the pushbutton (which determines how to defuse the phase)
+        button_color, button_target = genButton(serial)
+
+    if (DEBUG):
+        print(f"Serial number: {serial}")
+        print(f"Toggles target: {bin(toggles_target)[2:].zfill(4)}/{toggles_target}")
+        print(f"Wires target: {bin(wires_target)[2:].zfill(5)}/{wires_target}")
+        print(f"Keypad target: {keypad_target}/{passphrase}/{keyword}/{cipher_keyword}(rot={rot})")
+        print(f"Button target: {button_target}")
+
+    return serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target
+
+# generates the bomb's LCD bootup text
+def genBootText(serial, cipher_keyword, rot):
+    return f"Booting...\n\x00\x00"\
+           f"*Kernel v3.1.4-159 loaded.\n"\
+           f"Initializing subsystems...\n\x00"\
+           f"*System model: 102BOMBv4.2\n"\
+           f"*Serial number: {serial}\n"\
+           f"Encrypting keypad...\n\x00"\
+           f"*Keyword: {cipher_keyword}; key: {rot}\n"\
+           f"*{BOOT_LETTERS}\n"\
+           f"*{BOOT_DIGITS}\n"\
+           f"Rendering phases...\x00"
+
 ###############################
 # generate the bomb's specifics
 ###############################
-# generate the bomb's serial number (which also gets us the toggle and jumper target values)
-#  serial: the bomb's serial number
-#  toggles_target: the toggles phase defuse value
-#  wires_target: the wires phase defuse value
-serial, toggles_target, wires_target = genSerial()
-
-# generate the combination for the keypad phase
-#  keyword: the plaintext keyword for the lookup table
-#  cipher_keyword: the encrypted keyword for the lookup table
-#  rot: the key to decrypt the keyword
-#  keypad_target: the keypad phase defuse value (combination)
-#  passphrase: the target plaintext passphrase
-keyword, cipher_keyword, rot, keypad_target, passphrase = genKeypadCombination()
-
-# generate the color of the pushbutton (which determines how to defuse the phase)
-button_color = choice(["R", "G", "B"])
-# appropriately set the target (R is None)
-button_target = None
-# G is the first numeric digit in the serial number
-if (button_color == "G"):
-    button_target = [ n for n in serial if n.isdigit() ][0]
-    # modify the wires target (G is to cut wires B and D)
-    #  ABCDE
-    #  10101 = 21
-# B is the last numeric digit in the serial number
-elif (button_color == "B"):
-    button_target = [ n for n in serial if n.isdigit() ][-1]
-    # modify the wires target (B is to cut all wires except B, C, and D)
-    #  ABCDE
-    #  01110 = 14
-
-if (DEBUG):
-    print(f"Serial number: {serial}")
-    print(f"Toggles target: {bin(toggles_target)[2:].zfill(4)}/{toggles_target}")
-    print(f"Wires target: {bin(wires_target)[2:].zfill(5)}/{wires_target}")
-    print(f"Keypad target: {keypad_target}/{passphrase}/{keyword}/{cipher_keyword}(rot={rot})")
-    print(f"Button target: {button_target}")
+serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target = genPuzzle()
 
 # set the bomb's LCD bootup text
-boot_text = f"Booting...\n\x00\x00"\
-            f"*Kernel v3.1.4-159 loaded.\n"\
-            f"Initializing subsystems...\n\x00"\
-            f"*System model: 102BOMBv4.2\n"\
-            f"*Serial number: {serial}\n"\
-            f"Encrypting keypad...\n\x00"\
-            f"*Keyword: {cipher_keyword}; key: {rot}\n"\
-            f"*{' '.join(ascii_uppercase)}\n"\
-            f"*{' '.join([str(n % 10) for n in range(26)])}\n"\
-            f"Rendering phases...\x00"
+boot_text = genBootText(serial, cipher_keyword, rot)
@@ -0,0 +1,66 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# asyncio phase runtime
+# Team: Gourd
+#################################
+
+# import the configs
+from OUrConfigs import *
+# other imports
+from tkinter import TclError
+from time import monotonic
+import asyncio
+
+###########
+# functions
+###########
+# runs a phase as a coroutine (the same phase objects are used as with the threaded runtimes)
+# the phase is polled at an adaptive rate: fast right after it changes, and backing off (up to a bound) when it is idle;
+#  a watched input of the phase wakes the coroutine as soon as it changes (from whichever thread caught the change)
+async def run_phase(phase, fast=POLL_FAST, slow=POLL_SLOW):
+    loop = asyncio.get_running_loop()
+    woken = asyncio.Event()
+    phase._wake = lambda: loop.call_soon_threadsafe(woken.set)
+    phase._begin()
+    rate = phase._polling(fast, slow)
+    last = None
+    while (phase._running):
+        state, timestamp = phase._read(), monotonic()
+        phase._transition(state, timestamp)
+        if (state != last):
+            rate.activity(timestamp)
+        last = state
+        delay = rate.next(timestamp)
+        # the timer sleeps until its next tick is due (but no longer than the polling interval so that pausing is noticed)
+        due = getattr(phase, "_due", None)
+        if (due is not None):
+            delay = min(delay, max(0, due - monotonic()))
+        # sleep until the next poll is due, or a watched input changes
+        try:
+            await asyncio.wait_for(woken.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        woken.clear()
+
+# starts a task for each phase on the running event loop and returns the tasks
+def start_phases(phases, fast=POLL_FAST, slow=POLL_SLOW):
+    loop = asyncio.get_running_loop()
+    return [ loop.create_task(run_phase(phase, fast, slow), name=phase.name) for phase in phases ]
+
+# runs several phases until all of them have stopped (e.g., for simulated bombs)
+async def run_phases(phases, fast=POLL_FAST, slow=POLL_SLOW):
+    await asyncio.gather(*start_phases(phases, fast, slow))
+
+# drives the Tk GUI from the event loop (instead of window.mainloop()) so that one OS thread runs the GUI and the phases
+async def run_tk(window, interval=TK_FRAME_INTERVAL):
+    while (True):
+        try:
+            window.update()
+        # the window was destroyed
+        except TclError:
+            break
+        await asyncio.sleep(interval)
+
+# runs the Tk GUI (and any phases started from its callbacks) until the window is closed
+def mainloop(window):
+    asyncio.run(run_tk(window))
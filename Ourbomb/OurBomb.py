@@ -4,39 +4,48 @@
 # Team: Gourd
 #################################
 
+# note when the program started (for the startup report)
+from time import perf_counter
+started = perf_counter()
+
 # import the configs
 from OUrConfigs import *
 # import the phases
 from OurPhases import *
+# import the sound bank
+from OurSounds import *
+# import the game logic
+from OurGame import *
+# other imports
+from threading import Thread
 
 ###########
 # functions
 ###########
 # generates the bootup sequence on the LCD
-def bootup(n=0):
-    # if we're not animating (or we're at the end of the bootup text)
-    if (not ANIMATE or n == len(boot_text)):
-        # if we're not animating, render the entire text at once (and don't process \x00)
-        if (not ANIMATE):
-            gui._lscroll["text"] = boot_text.replace("\x00", "")
-        # configure the remaining GUI widgets
-        gui.setup()
-        # setup the phase threads, execute them, and check their statuses
-        if (RPi):
-            gui.after(1000, setup_phases)
-    # if we're animating
-    else:
-        # add the next character (but don't render \x00 since it specifies a longer pause)
-        if (boot_text[n] != "\x00"):
-            gui._lscroll["text"] += boot_text[n]
+def bootup():
+    gui.boot(boot_text, booted, ANIMATE)
 
-        # scroll the next character after a slight delay (\x00 is a longer delay)
-        gui.after(25 if boot_text[n] != "\x00" else 750, bootup, n + 1)
+# finishes the bootup once the bootup text is rendered
+def booted():
+    # configure the remaining GUI widgets
+    gui.setup()
+    # setup the phase threads, execute them, and check their statuses
+    gui.after(1000, setup_phases)
 
 # sets up the phase threads
 def setup_phases():
-    global timer, keypad, wires, button, toggles
-    
+    global timer, keypad, wires, button, toggles, scanner, game
+
+    # the hardware and the audio must be up
+    devices.join()
+    # they failed to come up -> show why (instead of hanging on the boot screen)
+    if (devices_error):
+        gui.showBootText(f"The bomb failed to start: {devices_error!r}")
+        raise devices_error
+    if (STARTUP_REPORT):
+        report_startup()
+
     # setup the timer thread
     timer = Timer(component_7seg, COUNTDOWN)
     # bind the 7-segment display to the LCD GUI so that it can be paused/unpaused from the GUI
@@ -44,199 +53,131 @@ def setup_phases():
     # setup the keypad thread
     keypad = Keypad(component_keypad, keypad_target)
     # setup the jumper wires thread
-    wires = Wires(component_wires, wires_target, display_length=5)
+    wires = Wires(component_wires, wires_target, display_length=5, debounce=WIRES_DEBOUNCE)
     # setup the pushbutton thread
     button = Button(component_button_state, component_button_RGB, button_target, button_color, timer)
     # bind the pushbutton to the LCD GUI so that its LED can be turned off when we quit
     gui.setButton(button)
     # setup the toggle switches thread
-    toggles = Toggles(component_toggles, toggles_target, display_length=4)
-
-    # start the phase threads
-    timer.start()
-    keypad.start()
-    wires.start()
-    button.start()
-    toggles.start()
-    
-    # play the tick audio
-    pygame.mixer.music.load(TICK)
-    pygame.mixer.music.play(-1)
-
-    # check the phases
-    gui.after(100, check_phases)
-
-# checks the phase threads
-def check_phases():
-    global active_phases, exploding
-
-    # restart the tick audio if neede
-    if not exploding and not pygame.mixer.music.get_busy():
-        pygame.mixer.music.load(TICK)
-        pygame.mixer.music.play(-1)
-        
-        
-    # check the timer
-    if (timer._running):
-        # update the GUI
-        gui._ltimer["text"] = f"Time left: {timer}"
-        # play the exploding audio at t-10s
-        if (not exploding and timer._interval * timer._value <= 9):
-            exploding = True
-            component_7seg.blink_rate = 1
-            pygame.mixer.music.load(EXPLODING)
-            pygame.mixer.music.play(1)
-        if (timer._value == 60):
-            gui._ltimer["fg"] = "#ff0000"
+    toggles = Toggles(component_toggles, toggles_target, display_length=4, debounce=TOGGLES_DEBOUNCE)
+
+    scanner = None
+    # start scanning the phases from a single thread
+    if (RUNTIME == "scanner"):
+        scanner = PhaseScanner([ timer, keypad, wires, button, toggles ])
+        scanner.start()
+    # or run the phases as coroutines on the GUI's event loop
+    elif (RUNTIME == "asyncio"):
+        import OurAsync
+        OurAsync.start_phases([ timer, keypad, wires, button, toggles ])
+    # or start the phase threads
     else:
-        # the countdown has expired -> explode!
-        # turn off the bomb and render the conclusion GUI
-        turn_off()
-        gui.after(100, gui.conclusion, exploding, False)
-        # don't check any more phases
-        return
-    # check the keypad
-    if (keypad._running):
-        # update the GUI
-        gui._lkeypad["text"] = f"Combination: {keypad}"
-        # the phase is defused -> stop the thread
-        if (keypad._defused):
-            keypad._running = False
-            gui._lkeypad["fg"] = "#00ff00"
-            defused()
-        # the phase has failed -> strike
-        elif (keypad._failed):
-            strike()
-            # reset the keypad
-            keypad._failed = False
-            keypad._value = ""
-    # check the wires
-    if (wires._running):
-        # update the GUI
-        gui._lwires["text"] = f"Wires: {wires}"
-        # the phase is defused -> stop the thread
-        if (wires._defused):
-            wires._running = False
-            gui._lwires["fg"] = "#00ff00"
-            defused()
-        # the phase has failed -> strike
-        elif (wires._failed):
-            strike()
-            # reset the wires
-            wires._failed = False
-    # check the button
-    if (button._running):
-        # update the GUI
-        gui._lbutton["text"] = f"Button: {button}"
-        # the phase is defused -> stop the thread
-        if (button._defused):
-            button._running = False
-            gui._lbutton["fg"] = "#00ff00"
-            defused()
-        # the phase has failed -> strike
-        elif (button._failed):
-            strike()
-            # reset the button
-            button._failed = False
-    # check the toggles
-    if (toggles._running):
-        # update the GUI
-        gui._ltoggles["text"] = f"Toggles: {toggles}"
-        # the phase is defused -> stop the thread
-        if (toggles._defused):
-            toggles._running = False
-            gui._ltoggles["fg"] = "#00ff00"
-            defused()
-        # the phase has failed -> strike
-        elif (toggles._failed):
-            strike()
-            # reset the toggles
-            toggles._failed = False
-
-    # note the strikes on the GUI
-    gui._lstrikes["text"] = f"Strikes left: {strikes_left}"
-    # too many strikes -> explode!
-    if (strikes_left == 0):
-        # turn off the bomb and render the conclusion GUI
-        turn_off()
-        gui.after(1000, gui.conclusion, exploding, False)
-        # stop checking phases
-        return
-    # a few strikes left -> timer goes twice as fast!
-    elif (strikes_left == 2 and not exploding):
-        timer._interval = 0.5
-        gui._lstrikes["fg"] = "#ff0000"
-    # one strike left -> timer goes even faster!
-    elif (strikes_left == 1 and not exploding):
-        timer._interval = 0.25
-
-    # the bomb has been successfully defused!
-    if (active_phases == 0):
-        # turn off the bomb and render the conclusion GUI
-        turn_off()
-        gui.after(100, gui.conclusion, exploding, True)
-        # stop checking phases
-        return
-
-    # check the phases again after a slight delay
-    gui.after(100, check_phases)
-
-# handles a strike
-def strike():
-    global strikes_left
+        timer.start()
+        keypad.start()
+        wires.start()
+        button.start()
+        toggles.start()
     
-    # note the strike
-    strikes_left -= 1
-    # play the strike audio
-    if (not exploding):
-        pygame.mixer.music.load(STRIKE)
-        pygame.mixer.music.play(1)
-
-# handles when a phase is defused
-def defused():
-    global active_phases
-
-    # note that the phase is defused
-    active_phases -= 1
-    # play the defused audio
-    if not exploding:
-        pygame.mixer.music.load(DEFUSED)
-        pygame.mixer.music.play(1)
-
-# turns off the bomb
-def turn_off():
-    # stop all threads
-    timer._running = False
-    keypad._running = False
-    wires._running = False
-    button._running = False
-    toggles._running = False
-
-    # turn off the 7-segment display
-    component_7seg.blink_rate = 0
-    component_7seg.fill(0)
-    # turn off the pushbutton's LED
-    for pin in button._rgb:
-        pin.value = True
+    # the game logic (rendered on the GUI)
+    game = BombGame(timer, keypad, wires, button, toggles, gui)
+    game.arm()
+
+    # check the phases whenever they send an event
+    phase_events.attach(gui, check_phases)
+
+# checks the phase that sent an event
+def check_phases(event):
+    game.handle(event)
+    # the game is over -> stop checking the phases
+    if (game.outcome is not None):
+        phase_events.detach()
+        if (scanner):
+            scanner._running = False
+        # print the latencies of the inputs
+        if (TRACE):
+            tracer.dump()
+
+# starts a new round in this process (the hardware, the window, and the sounds are kept)
+def reset():
+    global serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target
+    global boot_text
+
+    # generate a new puzzle
+    serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target = genPuzzle()
+    boot_text = genBootText(serial, cipher_keyword, rot)
+    # stop the conclusion audio and discard any events left over from the last round
+    sounds.stop()
+    phase_events.get_all()
+    # render the new bootup text all at once, configure the remaining GUI widgets, and setup the phases
+    gui.reset()
+    gui.showBootText(boot_text.replace("\x00", ""))
+    gui.setup()
+    setup_phases()
+
+# sets up the hardware and the audio (in the background, while the boot animation plays)
+# an error is kept (rather than lost with the thread) and raised by setup_phases()
+def setup_devices():
+    global component_7seg, component_keypad, component_wires, component_button_state, component_button_RGB, component_toggles, sounds
+    global devices_error
+
+    try:
+        # setup the electronic components
+        component_7seg, component_keypad, component_wires, component_button_state, component_button_RGB, component_toggles = setupComponents()
+        mark_startup("hardware")
+        # initialize the audio and decode the sounds once
+        initAudio(AUDIO_BUFFER)
+        sounds = SoundBank(SOUNDS)
+        # the GUI plays the conclusion sounds
+        gui.setSounds(sounds)
+        mark_startup("audio")
+    except Exception as error:
+        devices_error = error
+
+# notes how long the startup took to get to a point
+def mark_startup(name):
+    startup_marks.append((name, perf_counter() - started))
+
+# prints where the startup time went (use python -X importtime for a per-module breakdown of the imports)
+def report_startup():
+    last = 0
+    for name, elapsed in sorted(startup_marks, key=lambda mark: mark[1]):
+        print(f"{name:>12}: {elapsed * 1000:7.1f}ms (+{(elapsed - last) * 1000:.1f}ms)")
+        last = elapsed
+    # only report once
+    startup_marks.clear()
 
 ######
 # MAIN
 ######
 
-# initialize pygame
-pygame.init()
+# the startup marks (name, seconds since the program started)
+startup_marks = []
+mark_startup("imports")
 
 # initialize the LCD GUI
 window = Tk()
 gui = Lcd(window)
+# retrying starts a new round (instead of re-launching the program)
+gui.setReset(reset)
+mark_startup("window")
+# note when the first frame is drawn
+gui.after_idle(mark_startup, "first frame")
+
+# serve the latencies of the inputs
+if (TRACE and TRACE_PORT):
+    tracer.serve(TRACE_PORT)
 
-# initialize the bomb strikes, active phases (i.e., not yet defused), and if the bomb is exploding
-strikes_left = NUM_STRIKES
-active_phases = NUM_PHASES
-exploding = False
+# bring up the hardware and the audio in the background (and keep any error they fail with)
+devices_error = None
+devices = Thread(name="Devices", target=setup_devices, daemon=True)
+devices.start()
 
 # "boot" the bomb
 gui.after(1000, bootup)
 
 # display the LCD GUI
-window.mainloop()
+if (RUNTIME == "asyncio"):
+    import OurAsync
+    OurAsync.mainloop(window)
+else:
+    window.mainloop()
@@ -0,0 +1,101 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# 7-segment display driver
+# Team: Gourd
+#################################
+
+# imports
+from threading import Lock
+
+# the segments lit for each digit (bit 0 -> segment A, ..., bit 6 -> segment G)
+DIGIT_SEGMENTS = (0x3F, 0x06, 0x5B, 0x4F, 0x66, 0x6D, 0x7D, 0x07, 0x7F, 0x6F)
+# the segments of every mm:ss value that the timer can display
+#  e.g., "01:30" -> (0x3F, 0x06, 0x4F, 0x3F)
+TIMER_SEGMENTS = { f"{m:02}:{s:02}": (DIGIT_SEGMENTS[m // 10], DIGIT_SEGMENTS[m % 10], DIGIT_SEGMENTS[s // 10], DIGIT_SEGMENTS[s % 10])
+                   for m in range(100) for s in range(60) }
+
+#########
+# classes
+#########
+# wraps the 7-segment display (Seg7x4) so that every change is written in a single I2C transaction
+# the display's buffer is only written when it changes: the last rendered digits, blink rate, and brightness are cached
+#  and identical writes are skipped
+class SegmentDisplay:
+    def __init__(self, display):
+        # the wrapped display
+        self._display = display
+        # the buffer is written explicitly (with show())
+        self._display.auto_write = False
+        # the last rendered digits/text (None if unknown)
+        self._rendered = None
+        # the last blink rate and brightness
+        self._blink_rate = None
+        self._brightness = None
+        # the number of writes that were done and skipped
+        self._writes = 0
+        self._skipped = 0
+        # the timer thread and the GUI can both write to the display
+        self._lock = Lock()
+
+    # displays a value (mm:ss values use the precomputed segments; anything else is rendered by the display)
+    def print(self, value):
+        with self._lock:
+            value = str(value)
+            # the value is already displayed
+            if (value == self._rendered):
+                self._skipped += 1
+                return
+            segments = TIMER_SEGMENTS.get(value)
+            if (segments):
+                for i, bitmask in enumerate(segments):
+                    self._display.set_digit_raw(i, bitmask)
+                self._display.colon = True
+            else:
+                self._display.fill(0)
+                self._display.print(value)
+            self._show(value)
+
+    # fills the display (e.g., fill(0) turns it off)
+    def fill(self, color):
+        with self._lock:
+            if (self._rendered == ("fill", color)):
+                self._skipped += 1
+                return
+            self._display.fill(color)
+            self._show(("fill", color))
+
+    # the blink rate of the display (0 -> no blinking)
+    @property
+    def blink_rate(self):
+        return self._display.blink_rate
+
+    @blink_rate.setter
+    def blink_rate(self, rate):
+        with self._lock:
+            if (rate == self._blink_rate):
+                self._skipped += 1
+                return
+            self._display.blink_rate = rate
+            self._blink_rate = rate
+            self._writes += 1
+
+    # the brightness of the display (0 -> dimmest; 1 -> brightest)
+    @property
+    def brightness(self):
+        return self._display.brightness
+
+    @brightness.setter
+    def brightness(self, brightness):
+        with self._lock:
+            if (brightness == self._brightness):
+                self._skipped += 1
+                return
+            self._display.brightness = brightness
+            self._brightness = brightness
+            self._writes += 1
+
+    # writes the buffer to the display in one transaction (only internally called with the lock held)
+    def _show(self, rendered):
+        self._display.show()
+        self._rendered = rendered
+        self._writes += 1
@@ -0,0 +1,118 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Phase events (phases -> GUI)
+# Team: Gourd
+#################################
+
+# import the latency tracer
+from OurTrace import tracer
+# other imports
+from collections import namedtuple
+from queue import SimpleQueue, Empty
+from time import monotonic
+import tkinter
+import os
+
+# the kinds of phase events
+EVENT_VALUE = "value"       # the phase's value changed
+EVENT_DEFUSED = "defused"   # the phase was defused
+EVENT_FAILED = "failed"     # the phase failed (a strike)
+EVENT_TICK = "tick"         # the timer ticked (or expired)
+# how often the queue is polled (ms) if Tk can't watch the pipe
+EVENT_POLL_INTERVAL = 20
+
+# an event sent by a phase
+#  kind: the kind of event (see above)
+#  phase: the phase that sent the event
+#  value: the phase's value when the event was sent
+#  timestamp: when the event was sent (time.monotonic())
+#  trace: the ID of the event's latency trace (None if it isn't traced)
+PhaseEvent = namedtuple("PhaseEvent", ["kind", "phase", "value", "timestamp", "trace"])
+
+#########
+# classes
+#########
+# a thread-safe queue of phase events that the Tk main loop drains
+# every event is kept (so a strike can't be lost between checks), and the main loop only wakes up when there is an event:
+#  each event also writes a byte to a pipe that Tk watches
+class EventQueue:
+    def __init__(self):
+        # the events
+        self._queue = SimpleQueue()
+        # the pipe that wakes up the Tk main loop
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        # the widget (and handler) that the events are delivered to
+        self._widget = None
+        self._handler = None
+        # the after() id when the queue is polled (if Tk can't watch the pipe)
+        self._poll = None
+
+    # sends an event (caused by an input that happened at origin, e.g., the edge of a pin)
+    def put(self, kind, phase, value=None, origin=None):
+        timestamp = monotonic()
+        trace = tracer.start(phase.name, origin, timestamp)
+        self._queue.put(PhaseEvent(kind, phase, value, timestamp, trace))
+        try:
+            os.write(self._write_fd, b"\x00")
+        # the pipe is full (the main loop will wake up anyway)
+        except BlockingIOError:
+            pass
+
+    # returns (and removes) all of the events that have been sent
+    def get_all(self):
+        # empty the pipe
+        try:
+            while (os.read(self._read_fd, 4096)):
+                pass
+        except BlockingIOError:
+            pass
+        events = []
+        try:
+            while (True):
+                events.append(self._queue.get_nowait())
+        except Empty:
+            pass
+        return events
+
+    # delivers the events to a handler on the Tk main loop of a widget
+    def attach(self, widget, handler):
+        self._widget = widget
+        self._handler = handler
+        try:
+            widget.tk.createfilehandler(self._read_fd, tkinter.READABLE, self._dispatch)
+        # Tk can't watch the pipe on this platform -> poll the queue
+        except (AttributeError, tkinter.TclError):
+            self._poll = widget.after(EVENT_POLL_INTERVAL, self._dispatch)
+        # deliver any events that were sent before the queue was attached
+        if (not self._queue.empty()):
+            widget.after_idle(self._dispatch)
+
+    # stops delivering events
+    def detach(self):
+        if (self._widget is None):
+            return
+        if (self._poll):
+            self._widget.after_cancel(self._poll)
+            self._poll = None
+        else:
+            try:
+                self._widget.tk.deletefilehandler(self._read_fd)
+            except (AttributeError, tkinter.TclError):
+                pass
+        self._widget = None
+        self._handler = None
+
+    # delivers the events to the handler (only internally called on the Tk main loop)
+    def _dispatch(self, *args):
+        for event in self.get_all():
+            # the handler may have detached the queue (e.g., the bomb concluded)
+            if (self._handler is None):
+                break
+            self._handler(event)
+        if (self._poll):
+            self._poll = self._widget.after(EVENT_POLL_INTERVAL, self._dispatch)
+
+# the events of the bomb's phases
+phase_events = EventQueue()
@@ -0,0 +1,254 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Game engine (headless)
+# Team: Gourd
+#################################
+
+# import the configs
+from OUrConfigs import *
+# import the phases
+from OurPhases import *
+# import the simulated components
+from OurSim import FakePin, FakeKeypad, FakeSeg7x4
+# other imports
+from collections import deque
+
+#########
+# classes
+#########
+# the bomb's game logic: the timer, the strikes, the active phases (i.e., not yet defused), and the outcome
+# the game doesn't need a GUI: it tells a renderer (e.g., the Lcd) what to display and play, and it can either handle
+#  events sent to the GUI's event queue or (headless) collect the phases' events itself and be stepped in virtual time
+class BombGame:
+    def __init__(self, timer, keypad, wires, button, toggles, renderer=None, strikes=NUM_STRIKES, phases=NUM_PHASES):
+        # the timer and the phases (with their GUI label names and captions)
+        self._timer = timer
+        self._keypad = keypad
+        self._wires = wires
+        self._button = button
+        self._toggles = toggles
+        self._labels = { keypad: ("keypad", "Combination"), wires: ("wires", "Wires"), button: ("button", "Button"), toggles: ("toggles", "Toggles") }
+        # what the game is rendered on (None if headless)
+        self._renderer = renderer
+        # the bomb strikes, active phases, and if the bomb is exploding
+        self._strikes_left = strikes
+        self._active_phases = phases
+        self._exploding = False
+        # the outcome of the game (None -> still playing; True -> defused; False -> exploded)
+        self._outcome = None
+        # the events collected when the game is headless
+        self._events = deque()
+        # the current (virtual) time when the game is headless
+        self._now = 0
+        # reads the pins of every phase at once when the game is stepped
+        self._reader = PinReader([ pin for phase in self._phases() for pin in phase._pins() ])
+
+    # the outcome of the game (None -> still playing; True -> defused; False -> exploded)
+    @property
+    def outcome(self):
+        return self._outcome
+
+    # arms the bomb (the phases are run by a runtime, or by step())
+    def arm(self):
+        # play the tick audio
+        if (self._renderer):
+            self._renderer.playSound(TICK, loop=True)
+
+    # collects an event from a phase (phases of a headless game send their events to the game itself)
+    # a headless game runs in virtual time, so its events aren't traced
+    def put(self, kind, phase, value=None, origin=None):
+        self._events.append(PhaseEvent(kind, phase, value, self._now, None))
+
+    # handles an event sent by a phase
+    def handle(self, event):
+        # the game is already over
+        if (self._outcome is not None):
+            return
+        # the GUI updates (and strikes) that follow are recorded against the event's trace
+        tracer.handle(event.trace)
+        try:
+            self._handle(event)
+        finally:
+            tracer.current = None
+
+    # handles an event sent by a phase (only internally called)
+    def _handle(self, event):
+        # check the timer
+        if (event.phase is self._timer):
+            self._check_timer()
+        # check the other phases
+        elif (event.phase in self._labels):
+            self._check_phase(event)
+
+        # the game is over
+        if (self._outcome is not None):
+            return
+        # note the strikes on the GUI
+        self._show("strikes", text=f"Strikes left: {self._strikes_left}")
+        # too many strikes -> explode!
+        if (self._strikes_left == 0):
+            self._conclude(False, 1000)
+            return
+        # a few strikes left -> timer goes twice as fast!
+        elif (self._strikes_left == 2 and not self._exploding):
+            self._timer.set_interval(0.5, self._timestamp(event))
+            self._show("strikes", color="#ff0000")
+        # one strike left -> timer goes even faster!
+        elif (self._strikes_left == 1 and not self._exploding):
+            self._timer.set_interval(0.25, self._timestamp(event))
+
+        # the bomb has been successfully defused!
+        if (self._active_phases == 0):
+            self._conclude(True, 100)
+
+    # checks the timer (only internally called)
+    def _check_timer(self):
+        timer = self._timer
+        if (timer._running):
+            # update the GUI
+            self._show("timer", text=f"Time left: {timer}")
+            # play the exploding audio at t-10s
+            if (not self._exploding and timer._interval * timer._value <= 9):
+                self._exploding = True
+                timer._component.blink_rate = 1
+                self._play(EXPLODING, ambience=True)
+            if (timer._value == 60):
+                self._show("timer", color="#ff0000")
+        else:
+            # the countdown has expired -> explode!
+            self._conclude(False, 100)
+
+    # checks a (non-timer) phase (only internally called)
+    def _check_phase(self, event):
+        phase = event.phase
+        # the phase was already defused
+        if (not phase._running):
+            return
+        name, caption = self._labels[phase]
+        # update the GUI
+        self._show(name, text=f"{caption}: {phase}")
+        # the phase is defused -> stop the thread
+        if (event.kind == EVENT_DEFUSED):
+            phase.stop()
+            self._show(name, color="#00ff00")
+            self.defused()
+        # the phase has failed -> strike
+        elif (event.kind == EVENT_FAILED):
+            self.strike()
+            # reset the phase
+            phase._failed = False
+
+    # handles a strike
+    def strike(self):
+        # note the strike
+        self._strikes_left -= 1
+        tracer.mark(tracer.current, "strike")
+        # play the strike audio
+        if (not self._exploding):
+            self._play(STRIKE)
+
+    # handles when a phase is defused
+    def defused(self):
+        # note that the phase is defused
+        self._active_phases -= 1
+        # play the defused audio
+        if (not self._exploding):
+            self._play(DEFUSED)
+
+    # turns off the bomb
+    def turn_off(self):
+        # stop all phases
+        for phase in self._phases():
+            phase.stop()
+        # turn off the 7-segment display
+        self._timer._component.blink_rate = 0
+        self._timer._component.fill(0)
+        # turn off the pushbutton's LED
+        for pin in self._button._rgb:
+            pin.value = True
+
+    # ends the game, turns off the bomb, and renders the conclusion after a delay (ms)
+    def _conclude(self, success, delay):
+        self._outcome = success
+        self.turn_off()
+        if (self._renderer):
+            self._renderer.conclude(self._exploding, success, delay)
+
+    # renders a label (only internally called)
+    def _show(self, name, text=None, color=None):
+        if (self._renderer):
+            self._renderer.showLabel(name, text, color)
+
+    # plays a sound (only internally called)
+    def _play(self, sound, ambience=False):
+        if (self._renderer):
+            self._renderer.playSound(sound, ambience=ambience)
+
+    # returns the timer and the phases (only internally called)
+    def _phases(self):
+        return [ self._timer, self._keypad, self._wires, self._button, self._toggles ]
+
+    # returns the time of an event on the timer's clock (only internally called)
+    def _timestamp(self, event):
+        # a headless game runs in virtual time
+        return (self._now if event.phase._events is self else None)
+
+    #########################
+    # headless (virtual time)
+    #########################
+    # makes the phases send their events to the game (instead of the GUI's event queue)
+    def headless(self):
+        for phase in self._phases():
+            phase._events = self
+        return self
+
+    # scans every running phase at a (virtual) time and handles the events they send
+    def step(self, timestamp):
+        self._now = timestamp
+        snapshot = self._reader.read()
+        phases = [ phase for phase in self._phases() if phase._running ]
+        states = [ phase._read(snapshot) for phase in phases ]
+        for phase, state in zip(phases, states):
+            phase._transition(state, timestamp)
+        while (self._events):
+            self.handle(self._events.popleft())
+
+    # plays the game in virtual time: the steps are (time, function, arguments...) like those of ScriptedInput
+    # the game only steps when an input is due or the timer is due to tick, so it runs as fast as the logic allows
+    # the game gives up (with no outcome) after a limit of virtual time: by default, twice the countdown on its timer
+    def run(self, steps=(), limit=None):
+        steps = deque(sorted(steps, key=lambda step: step[0]))
+        if (limit is None):
+            limit = self._timer.remaining() * 2
+        # start the phases
+        for phase in self._phases():
+            phase._begin()
+        now = 0
+        while (self._outcome is None and now <= limit):
+            # apply the inputs that are due
+            while (steps and steps[0][0] <= now):
+                step = steps.popleft()
+                step[1](*step[2:])
+            self.step(now)
+            # the next time something can happen
+            due = [ steps[0][0] ] if steps else []
+            if (self._timer._running and self._timer._due is not None):
+                due.append(self._timer._due)
+            if (not due):
+                break
+            now = max(now, min(due))
+        return self._outcome
+
+###########
+# functions
+###########
+# builds a headless game on new simulated components (e.g., for balancing and regression runs)
+def simulatedGame(toggles_target, wires_target, keypad_target, button_color, button_target, countdown=COUNTDOWN, renderer=None):
+    timer = Timer(FakeSeg7x4(), countdown)
+    # the keypad is scanned whenever the game is stepped (rather than by a thread in real time)
+    keypad = Keypad(FakeKeypad(), keypad_target, scan_rate=None, debounce=0)
+    # the pins' edges happen when the game is stepped (so they are read, and releases are judged, in virtual time)
+    wires = Wires([ FakePin(True) for i in range(5) ], wires_target, display_length=5, watch=False)
+    button = Button(FakePin(False), [ FakePin(True) for i in range(3) ], button_target, button_color, timer, watch=False)
+    toggles = Toggles([ FakePin(False) for i in range(4) ], toggles_target, display_length=4, watch=False)
+    return BombGame(timer, keypad, wires, button, toggles, renderer).headless()
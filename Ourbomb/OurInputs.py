@@ -0,0 +1,646 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Input engine (edge-triggered GPIO pins)
+# Team: Gourd
+#################################
+
+# import the configs
+from OUrConfigs import *
+# other imports
+from collections import namedtuple, deque
+from threading import Thread, Condition, Lock, Event
+from time import monotonic, sleep
+from select import select
+from glob import glob
+import os
+# on the RPi, edge interrupts come from RPi.GPIO, or from libgpiod (v2) where RPi.GPIO can't detect edges (e.g., on the
+#  RPi 5); if neither is available, the pins are sampled instead
+try:
+    import RPi.GPIO as GPIO
+except (ImportError, RuntimeError):
+    GPIO = None
+try:
+    import gpiod
+    from gpiod.line import Edge
+except ImportError:
+    gpiod = None
+
+# a single (debounced) pin transition
+#  index: the index of the pin in the component
+#  value: the new (stable) value of the pin
+#  timestamp: when the transition happened (time.monotonic())
+PinEdge = namedtuple("PinEdge", ["index", "value", "timestamp"])
+
+# a single (debounced) key press or release
+#  key: the key (e.g., 1, "*")
+#  pressed: True if the key was pressed, False if it was released
+#  timestamp: when the key was pressed/released (time.monotonic())
+KeyEvent = namedtuple("KeyEvent", ["key", "pressed", "timestamp"])
+
+# keys that were held down together (a chord), reported once every key has been released
+#  keys: the keys (in keypad order, e.g., (1, 5))
+#  timestamp: when the last of the keys was released (time.monotonic())
+KeyChord = namedtuple("KeyChord", ["keys", "timestamp"])
+
+#########
+# classes
+#########
+# watches a list of pins and blocks until one of them changes
+# each pin can have its own debounce window (seconds); the first edge is accepted immediately (low latency) and any
+#  bouncing within the window is ignored, after which the pin is re-read to catch the level it settled on
+class EdgeWatcher:
+    def __init__(self, pins, debounce=DEBOUNCE, notify=None):
+        # the pins being watched
+        self._pins = list(pins)
+        # called (from the thread that caught the edge) after each transition (e.g., to wake up a scanner)
+        self._notify = notify
+        # the debounce window of each pin (a single value applies to all of the pins)
+        if (isinstance(debounce, (int, float))):
+            debounce = [ debounce ] * len(self._pins)
+        self._debounce = list(debounce)
+        # the current (stable) value of each pin
+        self._values = [ pin.value for pin in self._pins ]
+        # when each pin last changed (so that bounces can be ignored)
+        self._changed = [ float("-inf") ] * len(self._pins)
+        # pins that bounced during their debounce window (and must be re-read once it has passed)
+        self._pending = set()
+        # the transitions that haven't been consumed yet
+        self._edges = deque()
+        # lets the consumer block until there is a transition
+        self._cond = Condition()
+        # the GPIO channels that have edge detection enabled (and the pin index of each)
+        self._channels = {}
+        # are the pins' edge events read from libgpiod?
+        self._lines = False
+        # the pins that call back when they change (simulated pins)
+        self._watched = {}
+        # are the pins sampled (if edge detection isn't available)?
+        self._sampled = False
+        self._running = True
+        # prefer hardware edge detection (RPi.GPIO, then libgpiod) or simulated pins that call back, and fall back to
+        #  sampling the pins (along with every other sampled watcher's, by a single thread)
+        if (not self._watch_gpio() and not self._watch_lines() and not self._watch_pins()):
+            self._sampled = True
+            _sampler.add(self)
+
+    # the current (stable) value of each pin
+    @property
+    def values(self):
+        with self._cond:
+            return list(self._values)
+
+    # the current (stable) value of the pins as a bitmask (the first pin is the most significant bit)
+    @property
+    def mask(self):
+        with self._cond:
+            mask = 0
+            for value in self._values:
+                mask = (mask << 1) | value
+            return mask
+
+    # blocks until at least one pin changes (or the timeout expires) and returns the transitions
+    def wait(self, timeout=None):
+        deadline = (None if timeout is None else monotonic() + timeout)
+        with self._cond:
+            while (self._running):
+                # pins that bounced may have settled on a new level
+                now = monotonic()
+                self._settle(now)
+                if (self._edges):
+                    edges = list(self._edges)
+                    self._edges.clear()
+                    return edges
+                # wait until there's a transition, a pending pin's window ends, or the timeout expires
+                wake = [ self._changed[i] + self._debounce[i] for i in self._pending ]
+                if (deadline is not None):
+                    if (deadline <= now):
+                        break
+                    wake.append(deadline)
+                self._cond.wait(min(wake) - now if wake else None)
+        return []
+
+    # stops watching the pins
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        for channel in self._channels:
+            try:
+                GPIO.remove_event_detect(channel)
+            except RuntimeError:
+                pass
+        self._channels = {}
+        if (self._lines):
+            _line_events.unwatch(self)
+            self._lines = False
+        for pin in self._pins:
+            if (id(pin) in self._watched):
+                pin.unwatch(self._on_pin)
+        self._watched = {}
+        if (self._sampled):
+            _sampler.remove(self)
+            self._sampled = False
+
+    # notes a (possible) transition of a pin (only internally called)
+    # the pin is read unless the edge came with its new value
+    def _edge(self, index, timestamp, value=None):
+        with self._cond:
+            if (value is None):
+                value = self._pins[index].value
+            # the pin bounced back to where it was
+            if (value == self._values[index]):
+                return
+            # the pin is still bouncing -> re-read it once its debounce window has passed
+            if (timestamp - self._changed[index] < self._debounce[index]):
+                self._pending.add(index)
+                self._cond.notify_all()
+                return
+            # a real transition
+            self._accept(index, value, timestamp)
+
+    # records a transition (only internally called with the lock held)
+    def _accept(self, index, value, timestamp):
+        self._values[index] = value
+        self._changed[index] = timestamp
+        self._edges.append(PinEdge(index, value, timestamp))
+        self._cond.notify_all()
+        if (self._notify):
+            self._notify()
+
+    # re-reads the pins whose debounce window has passed (only internally called with the lock held)
+    def _settle(self, now):
+        for i in [ i for i in self._pending if now - self._changed[i] >= self._debounce[i] ]:
+            self._pending.discard(i)
+            value = self._pins[i].value
+            if (value != self._values[i]):
+                self._accept(i, value, now)
+
+    # enables GPIO edge detection on the pins (only internally called)
+    def _watch_gpio(self):
+        if (GPIO is None):
+            return False
+        try:
+            for i, pin in enumerate(self._pins):
+                # digitalio pins know their BCM channel
+                channel = pin._pin.id
+                self._channels[channel] = i
+                GPIO.add_event_detect(channel, GPIO.BOTH, callback=self._on_gpio)
+        except (AttributeError, RuntimeError, ValueError):
+            self.close()
+            self._running = True
+            return False
+        return True
+
+    # requests the pins' edge events from libgpiod (only internally called)
+    def _watch_lines(self):
+        self._lines = _line_events.watch(self, self._pins)
+        return self._lines
+
+    # watches pins that call back when they change (e.g., simulated pins) (only internally called)
+    def _watch_pins(self):
+        if (not all([ hasattr(pin, "watch") for pin in self._pins ])):
+            return False
+        for i, pin in enumerate(self._pins):
+            self._watched[id(pin)] = i
+            pin.watch(self._on_pin)
+        return True
+
+    # called (from the thread that changed the pin) when a watched pin changes
+    def _on_pin(self, pin):
+        self._edge(self._watched[id(pin)], monotonic())
+
+    # called (from the RPi.GPIO thread) when a pin changes
+    def _on_gpio(self, channel):
+        self._edge(self._channels[channel], monotonic())
+
+    # samples the pins once (called by the shared sampler thread when edge detection isn't available)
+    def _sample(self):
+        now = monotonic()
+        for i, pin in enumerate(self._pins):
+            if (pin.value != self._values[i]):
+                self._edge(i, now)
+
+# reads the edge events of GPIO lines from libgpiod: a single thread blocks on the lines of every watcher, so idle pins
+#  cost nothing
+# the lines must not already be claimed by another library (otherwise the watcher falls back to sampling)
+class LineEvents:
+    def __init__(self):
+        # the line requests being read: file descriptor -> (request, watcher, line offset -> pin index)
+        self._requests = {}
+        # the requests that were given up by their watchers (they're released by the thread, so that it never waits on
+        #  a closed file)
+        self._released = []
+        self._lock = Lock()
+        # the GPIO chip of the header pins
+        self._path = None
+        # the thread, and a pipe that wakes it up when the requests change
+        self._thread = None
+        self._wake = None
+
+    # requests the edge events of a watcher's pins; returns whether libgpiod is watching them
+    def watch(self, watcher, pins):
+        if (gpiod is None):
+            return False
+        try:
+            # digitalio pins know their BCM channel (the line offset on the header pins' chip)
+            offsets = [ pin._pin.id for pin in pins ]
+            settings = gpiod.LineSettings(edge_detection=Edge.BOTH)
+            request = gpiod.request_lines(self._chip(), consumer="bomb", config={ tuple(offsets): settings })
+        except (AttributeError, OSError, TypeError, ValueError):
+            return False
+        with self._lock:
+            self._requests[request.fd] = (request, watcher, { offset: i for i, offset in enumerate(offsets) })
+            if (self._thread is None):
+                self._wake = os.pipe()
+                self._thread = Thread(name="LineEvents", target=self._run, daemon=True)
+                self._thread.start()
+        os.write(self._wake[1], b"\0")
+        return True
+
+    # gives up the edge events of a watcher's pins
+    def unwatch(self, watcher):
+        with self._lock:
+            for fd, (request, owner, lines) in list(self._requests.items()):
+                if (owner is watcher):
+                    del self._requests[fd]
+                    self._released.append(request)
+        if (self._wake):
+            os.write(self._wake[1], b"\0")
+
+    # returns the GPIO chip of the header pins (only internally called)
+    def _chip(self):
+        if (self._path is None):
+            for path in sorted(glob("/dev/gpiochip*")):
+                with gpiod.Chip(path) as chip:
+                    if (chip.get_info().label.startswith("pinctrl-")):
+                        self._path = path
+                        break
+            else:
+                raise OSError("there's no GPIO chip for the header pins")
+        return self._path
+
+    # reads the edge events (only internally called by the thread)
+    # the events are timestamped by the kernel (on the monotonic clock, like time.monotonic())
+    def _run(self):
+        while (True):
+            with self._lock:
+                fds = list(self._requests)
+            ready = select([ self._wake[0] ] + fds, [], [])[0]
+            with self._lock:
+                # release the requests that were given up (now that they aren't being waited on)
+                for request in self._released:
+                    request.release()
+                self._released = []
+                requests = [ self._requests[fd] for fd in ready if fd in self._requests ]
+            if (self._wake[0] in ready):
+                os.read(self._wake[0], 4096)
+            for request, watcher, lines in requests:
+                for event in request.read_edge_events():
+                    watcher._edge(lines[event.line_offset], event.timestamp_ns / 1e9, event.event_type == gpiod.EdgeEvent.Type.RISING_EDGE)
+
+# samples the pins of every watcher that doesn't have edge detection, from a single thread (which only runs while there
+#  are pins to sample)
+class PinSampler:
+    def __init__(self, interval=EDGE_SAMPLE_INTERVAL):
+        # how often the pins are sampled (seconds)
+        self._interval = interval
+        # the watchers whose pins are sampled
+        self._watchers = []
+        self._lock = Lock()
+        self._thread = None
+
+    # starts sampling a watcher's pins
+    def add(self, watcher):
+        with self._lock:
+            self._watchers.append(watcher)
+            if (self._thread is None):
+                self._thread = Thread(name="PinSampler", target=self._run, daemon=True)
+                self._thread.start()
+
+    # stops sampling a watcher's pins
+    def remove(self, watcher):
+        with self._lock:
+            if (watcher in self._watchers):
+                self._watchers.remove(watcher)
+
+    # samples the pins (only internally called by the thread)
+    def _run(self):
+        while (True):
+            with self._lock:
+                watchers = list(self._watchers)
+                # there's nothing left to sample -> the thread ends (it is restarted by the next watcher)
+                if (not watchers):
+                    self._thread = None
+                    return
+            for watcher in watchers:
+                watcher._sample()
+            sleep(self._interval)
+
+# adapts how often something is polled to its recent activity: it is polled at the fast rate right after it changes
+#  (and for a while after), and then each poll waits a little longer, up to the slow rate (so the latency is bounded)
+class AdaptiveRate:
+    def __init__(self, fast=POLL_FAST, slow=POLL_SLOW, hold=POLL_HOLD, backoff=POLL_BACKOFF):
+        # the shortest and longest intervals (seconds)
+        self._fast = fast
+        self._slow = max(fast, slow)
+        # how long the fast rate is kept after activity (seconds), and how much each idle interval grows
+        self._hold = hold
+        self._backoff = backoff
+        # the current interval (seconds) and when there was last activity
+        self._interval = fast
+        self._active = float("-inf")
+
+    # the current interval (seconds)
+    @property
+    def interval(self):
+        return self._interval
+
+    # notes activity (e.g., the polled state changed)
+    def activity(self, timestamp):
+        self._active = timestamp
+        self._interval = self._fast
+
+    # returns how long to wait (seconds) until the next poll
+    def next(self, timestamp):
+        if (timestamp - self._active >= self._hold):
+            self._interval = min(self._slow, self._interval * self._backoff)
+        return self._interval
+
+# scans a keypad matrix (in its own thread) and buffers every key press and release
+# the keypad is scanned at the full rate while keys are being pressed, and backs off to the idle rate when it isn't used
+# while no key is pressed, a keypad whose presses can be watched is armed instead of being scanned: every row is driven
+#  low and the columns are watched, so the first key press (which pulls its column low) wakes the scanner (and calls
+#  notify, e.g., to wake a runtime that polls the keypad phase); only the columns are checked (not the whole matrix) until
+#  then, and the idle rate only bounds how long a press that wasn't caught can wait
+# each scan is decoded into a bitmask of the keys (bit n -> the nth key, row by row), so every key that is held down is
+#  seen (not just the first); each key is debounced on its own (a change is accepted immediately, and any bouncing
+#  within the debounce window is ignored); the events go into a bounded ring buffer so that the keypad phase consumes
+#  every key, however fast it's typed
+# a matrix without diodes "ghosts": when three keys at the corners of a rectangle are held down, the fourth corner reads
+#  as pressed too; scans that could hold a ghost are ignored (the keys keep their last state) until a key is released
+# keys that are held down together are also reported as a chord once they have all been released
+# with no scan rate, there's no thread: the keypad is scanned whenever the events are read (e.g., by a runtime that polls
+#  the keypad phase, or in virtual time)
+class KeyScanner:
+    def __init__(self, keypad, rate=KEYPAD_SCAN_RATE, debounce=KEYPAD_DEBOUNCE, size=KEYPAD_BUFFER, idle_rate=KEYPAD_IDLE_SCAN_RATE, notify=None):
+        # the keypad matrix
+        self._keypad = keypad
+        # can the key presses be watched? is the keypad armed (and what is watching its columns)? and is a key press
+        #  waking the scanner?
+        self._watchable = KeyScanner.watchable(keypad)
+        self._armed = False
+        self._watcher = None
+        self._woken = Event()
+        # called (from the thread that caught it) when a key is pressed while the keypad is armed
+        self._notify = notify
+        # the keys (in keypad order) and the bit of each
+        self._keys = [ key for row in keypad.keys for key in row ]
+        self._bits = { key: 1 << i for i, key in enumerate(self._keys) }
+        # the key masks that could hold a ghost
+        self._ghosted = _ghost_table(len(keypad.keys), len(keypad.keys[0]))
+        # how long to wait between scans (None if there's no thread)
+        self._rate = (AdaptiveRate(1 / rate, POLL_WATCHED if self._watchable else 1 / (idle_rate or rate)) if rate else None)
+        # the debounce window of each key (seconds)
+        self._debounce = debounce
+        # the (debounced) keys that are held down (a mask), and when each key last changed
+        self._held = 0
+        self._changed = [ float("-inf") ] * len(self._keys)
+        # the events that haven't been consumed yet (the oldest are dropped if the consumer falls behind)
+        self._events = deque(maxlen=size)
+        self._dropped = 0
+        # the keys held down since the keypad was last idle (a mask), and the chords that haven't been consumed yet
+        self._chord = 0
+        self._chords = deque(maxlen=size)
+        # when the most recent keys were pressed (to measure the typing rate), the number of scans done, and the number
+        #  of scans that were ignored because of ghosting
+        self._presses = deque(maxlen=KEYPAD_RATE_WINDOW)
+        self._scans = 0
+        self._ghosts = 0
+        # lets the consumer block until there is an event
+        self._cond = Condition()
+        self._running = True
+        self._thread = None
+        if (self._rate):
+            self._thread = Thread(name="KeyScanner", target=self._run, daemon=True)
+            self._thread.start()
+
+    # the keys that are held down (in keypad order)
+    @property
+    def held(self):
+        with self._cond:
+            return self._decode(self._held)
+
+    # can the key presses of a keypad be watched? (a simulated keypad that calls back, or a matrix whose row and column
+    #  pins are known, e.g., adafruit_matrixkeypad.Matrix_Keypad)
+    @staticmethod
+    def watchable(keypad):
+        return (hasattr(keypad, "watch") or (hasattr(keypad, "_row_pins") and hasattr(keypad, "_col_pins")))
+
+    # scans the keypad once and buffers the keys that were pressed or released
+    # returns True if a key was pressed or released
+    def scan(self, timestamp=None):
+        # the keypad is armed and no key is pressed -> it is still idle
+        if (self._armed and not self._pressing()):
+            return False
+        self._disarm()
+        # the keypad's list of keys is only read once (so that it can't change under us)
+        mask = 0
+        for key in self._keypad.pressed_keys:
+            mask |= self._bits.get(key, 0)
+        now = (monotonic() if timestamp is None else timestamp)
+        changed = self._apply(mask, now)
+        # no key is pressed (or held down) -> arm the keypad until one is
+        if (not mask and not self._held):
+            self._arm()
+        return changed
+
+    # returns (and removes) the buffered events, in order
+    def events(self):
+        if (self._thread is None):
+            self.scan()
+        with self._cond:
+            events = list(self._events)
+            self._events.clear()
+            return events
+
+    # blocks until there is an event (or the timeout expires) and returns (and removes) the buffered events
+    def wait(self, timeout=None):
+        with self._cond:
+            if (not self._events and self._running):
+                self._cond.wait(timeout)
+        return self.events()
+
+    # returns (and removes) the chords that have been played, in order
+    def chords(self):
+        with self._cond:
+            chords = list(self._chords)
+            self._chords.clear()
+            return chords
+
+    # returns the sustained typing rate (keys/sec) over the most recent presses
+    def rate(self):
+        with self._cond:
+            if (len(self._presses) < 2 or self._presses[-1] == self._presses[0]):
+                return 0
+            return (len(self._presses) - 1) / (self._presses[-1] - self._presses[0])
+
+    # stops scanning the keypad
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        # the thread disarms the keypad when it ends
+        self._woken.set()
+        if (self._thread is None):
+            self._disarm()
+
+    # returns the keys of a mask (in keypad order) (only internally called)
+    def _decode(self, mask):
+        return tuple([ key for i, key in enumerate(self._keys) if (mask >> i) & 1 ])
+
+    # applies a scan of the keys (a mask) and buffers the keys that were pressed or released (only internally called)
+    # returns True if a key was pressed or released
+    def _apply(self, mask, now):
+        with self._cond:
+            self._scans += 1
+            # a key may be a ghost -> ignore the scan
+            if (self._ghosted[mask]):
+                self._ghosts += 1
+                return False
+            changes = mask ^ self._held
+            if (not changes):
+                return False
+            # the releases come first, then the presses (each in keypad order)
+            for pressed, bits in ((False, changes & self._held), (True, changes & mask)):
+                for i, key in enumerate(self._keys):
+                    # the key didn't change, or it is still bouncing
+                    if (not (bits >> i) & 1 or now - self._changed[i] < self._debounce):
+                        continue
+                    self._held ^= 1 << i
+                    self._changed[i] = now
+                    if (pressed):
+                        self._presses.append(now)
+                    # the buffer is full -> the oldest event is dropped
+                    if (len(self._events) == self._events.maxlen):
+                        self._dropped += 1
+                    self._events.append(KeyEvent(key, pressed, now))
+            # note the chord once every key has been released
+            self._chord |= self._held
+            if (not self._held and self._chord):
+                if (bin(self._chord).count("1") > 1):
+                    self._chords.append(KeyChord(self._decode(self._chord), now))
+                self._chord = 0
+            self._cond.notify_all()
+            return True
+
+    # is a key pressed while the keypad is armed? (only internally called)
+    # only the columns are read (every row is driven low, so a press pulls its column low)
+    def _pressing(self):
+        if (self._watcher is None):
+            return bool(self._keypad.pressed_keys)
+        return not all([ pin.value for pin in self._keypad._col_pins ])
+
+    # arms the keypad so that a key press wakes the scanner (only internally called)
+    def _arm(self):
+        if (self._armed or not self._watchable or not self._running):
+            return
+        self._armed = True
+        # a simulated keypad calls back itself
+        if (hasattr(self._keypad, "watch")):
+            self._keypad.watch(self._on_press)
+            return
+        # drive every row low and watch the columns (pulled up), so that any key press pulls a column low
+        for pin in self._keypad._row_pins:
+            pin.switch_to_output(value=False)
+        self._watcher = EdgeWatcher(self._keypad._col_pins, 0, self._on_press)
+
+    # stops watching the keypad (only internally called)
+    # the rows don't need to be released: the keypad sets every pin back to an input (pulled up) when it is scanned
+    def _disarm(self):
+        if (not self._armed):
+            return
+        self._armed = False
+        if (self._watcher is None):
+            self._keypad.unwatch(self._on_press)
+        else:
+            self._watcher.close()
+            self._watcher = None
+
+    # called (from the thread that caught it) when a key is pressed while the keypad is armed
+    def _on_press(self, keypad=None):
+        if (self._armed):
+            self._woken.set()
+            if (self._notify):
+                self._notify()
+
+    # scans the keypad (only internally called by the thread)
+    def _run(self):
+        due = monotonic()
+        while (self._running):
+            self._woken.clear()
+            # keys are held down or were pressed/released -> scan at the full rate
+            if (self.scan() or self._held):
+                self._rate.activity(due)
+            # wait until the next scan is due, or a key is pressed while the keypad is armed (if a scan ran late, don't
+            #  try to catch up)
+            due += self._rate.next(due)
+            delay = due - monotonic()
+            if (delay <= 0 or self._woken.wait(delay)):
+                due = monotonic()
+        self._disarm()
+
+# the levels of every pin, read at one instant (a snapshot is never changed once it is read)
+#  levels: the level of every line (bit n -> line n)
+#  timestamp: when the levels were read (time.monotonic())
+#  lines: the line of each pin (shared by every snapshot of a reader)
+class PinSnapshot(namedtuple("PinSnapshot", ["levels", "timestamp", "lines"])):
+    __slots__ = ()
+
+    # returns the value of a pin
+    def value(self, pin):
+        return bool((self.levels >> self.lines[pin]) & 1)
+
+    # returns the values of some pins as a bitmask (the first pin is the most significant bit)
+    def mask(self, pins):
+        mask = 0
+        for pin in pins:
+            mask = (mask << 1) | ((self.levels >> self.lines[pin]) & 1)
+        return mask
+
+# reads every pin once into a snapshot, so that the phases all see the same levels
+# the levels are raw (not debounced): pins that bounce (e.g., the wires and toggles) should be watched by an EdgeWatcher
+#  instead (which is the default on the RPi, so only unwatched pins, e.g., simulated ones in virtual time, are read here)
+class PinReader:
+    def __init__(self, pins):
+        # the pins that are read (a pin can be in the list more than once)
+        self._pins = list(dict.fromkeys(pins))
+        # the line of each pin (its position)
+        self._lines = { pin: i for i, pin in enumerate(self._pins) }
+
+    # reads every pin and returns the snapshot
+    def read(self):
+        levels = 0
+        for line, pin in enumerate(self._pins):
+            levels |= pin.value << line
+        return PinSnapshot(levels, monotonic(), self._lines)
+
+###########
+# functions
+###########
+# returns a table of which key masks of a keypad matrix could hold a ghost (only internally called)
+# a ghost is possible when two rows have (at least) two columns in common, i.e., the keys are the corners of a rectangle
+def _ghost_table(rows, cols):
+    shape = (rows, cols)
+    if (shape not in _ghost_tables):
+        table = bytearray(1 << (rows * cols))
+        for mask in range(len(table)):
+            row_masks = [ (mask >> (row * cols)) & ((1 << cols) - 1) for row in range(rows) ]
+            table[mask] = any([ bin(a & b).count("1") > 1 for i, a in enumerate(row_masks) for b in row_masks[i + 1:] ])
+        _ghost_tables[shape] = table
+    return _ghost_tables[shape]
+
+# the ghost tables of the keypad matrices that have been scanned (by shape)
+_ghost_tables = {}
+# the edge events read from libgpiod, and the pins sampled without edge detection (shared by every watcher)
+_line_events = LineEvents()
+_sampler = PinSampler()
@@ -6,20 +6,143 @@
 
 # import the configs
 from OUrConfigs import *
+# import the input engine
+from OurInputs import *
+# import the phase events
+from OurEvents import *
 # other imports
 from tkinter import *
 import tkinter
-from threading import Thread
-import pygame
-from time import sleep
+from threading import Thread, Condition, Event
+from time import monotonic
+from bisect import bisect_right
+from collections import namedtuple
+from math import floor
 import os
 import sys
 
+# what the timer displays at an instant
+#  value: the timer's value (seconds left at the current rate; -1 -> expired)
+#  margin: how far the instant is from the nearest tick (seconds; positive -> before the next tick, negative -> after
+#   the last tick)
+TimerReading = namedtuple("TimerReading", ["value", "margin"])
+
+# a release of the pushbutton and how it was judged
+#  timestamp: when the pushbutton was released (time.monotonic())
+#  reading: what the timer displayed at that instant (a TimerReading)
+#  success: was it released at the right time?
+ButtonRelease = namedtuple("ButtonRelease", ["timestamp", "reading", "success"])
+
 #########
 # classes
 #########
+# remembers what each widget of the GUI displays so that only real changes are rendered
+# each configure() is a Tcl round-trip (and can relayout the grid), so unchanged text/colors are skipped
+class ViewModel:
+    def __init__(self):
+        # the options last rendered for each widget (widget -> {option: value})
+        self._rendered = {}
+        # the number of redraws that were done and skipped
+        self._redraws = 0
+        self._skipped = 0
+
+    # renders the options (e.g., text, fg) of a widget that changed; returns whether the widget was redrawn
+    def render(self, widget, **options):
+        rendered = self._rendered.setdefault(widget, {})
+        changes = { option: value for option, value in options.items() if rendered.get(option) != value }
+        if (not changes):
+            self._skipped += 1
+            return False
+        widget.configure(**changes)
+        rendered.update(changes)
+        self._redraws += 1
+        return True
+
+    # forgets what the widgets display (e.g., when they are destroyed)
+    def forget(self):
+        self._rendered = {}
+
+# renders the boot text on a (read-only) text widget one character at a time (a \x00 is a longer pause and isn't
+#  rendered)
+# when each character appears is precomputed, and each frame renders the part of the text that is due by then (so a late
+#  frame catches up instead of slowing the animation down) and is scheduled for when the next character is due
+# the characters are appended to the widget, so each frame only inserts what became due since the last one (rather than
+#  rewriting the whole text, which gets longer with every character)
+class BootRenderer:
+    def __init__(self, widget, text, done, char_delay=25, pause_delay=750):
+        # the text widget the text is rendered on
+        self._widget = widget
+        # called when the whole text has been rendered
+        self._done = done
+        # the text without the pauses
+        self._text = text.replace("\x00", "")
+        # when (ms after the animation starts) each character of the text appears, and when the animation ends
+        self._times = []
+        t = 0
+        for c in text:
+            if (c == "\x00"):
+                t += pause_delay
+            else:
+                self._times.append(t)
+                t += char_delay
+        self._end = t
+        # the number of characters rendered
+        self._shown = 0
+        # when the animation started, and the next frame's after() id
+        self._start = None
+        self._after = None
+
+    # starts the animation
+    def start(self):
+        self._start = monotonic()
+        self._frame()
+
+    # skips to the end of the animation
+    def skip(self):
+        if (self._start is None or self._after is None):
+            return
+        self._widget.after_cancel(self._after)
+        self._after = None
+        self._render(len(self._text))
+        self._done()
+
+    # renders the characters that are due and schedules the next frame (only internally called)
+    def _frame(self):
+        self._after = None
+        elapsed = (monotonic() - self._start) * 1000
+        self._render(bisect_right(self._times, elapsed))
+        # the animation is over
+        if (elapsed >= self._end):
+            self._done()
+            return
+        # the next frame is due when the next character is (or when the animation ends)
+        due = (self._times[self._shown] if self._shown < len(self._times) else self._end)
+        self._after = self._widget.after(max(1, int(due - elapsed)), self._frame)
+
+    # renders the first n characters by appending the ones that aren't rendered yet (only internally called)
+    def _render(self, n):
+        if (n > self._shown):
+            self._widget.configure(state=NORMAL)
+            self._widget.insert(END, self._text[self._shown:n])
+            self._widget.configure(state=DISABLED)
+            self._shown = n
+
+# what a game is rendered on (the game tells it what to display and play)
+class Renderer:
+    # renders a label (timer, keypad, wires, button, toggles, or strikes); None leaves the text/color as is
+    def showLabel(self, name, text=None, color=None):
+        pass
+
+    # plays a sound (looped or once, on the ambience channel or as an effect)
+    def playSound(self, name, loop=False, ambience=False):
+        pass
+
+    # renders the conclusion (explosion/defusion) after a delay (ms)
+    def conclude(self, exploding, success, delay):
+        pass
+
 # the LCD display GUI
-class Lcd(Frame):
+class Lcd(Frame, Renderer):
     def __init__(self, window):
         super().__init__(window, bg="black")
         # make the GUI fullscreen
@@ -28,6 +151,14 @@ class Lcd(Frame):
         self._timer = None
         # we need to know about the pushbutton to turn off its LED when the program exits
         self._button = None
+        # we need the sound bank to play the conclusion sounds
+        self._sounds = None
+        # we need to know how to start a new round (without re-launching the program)
+        self._reset = None
+        # the labels are only redrawn when what they display changes
+        self._view = ViewModel()
+        # the boot text renderer (while the boot text is rendered)
+        self._boot = None
         # setup the initial "boot" GUI
         self.setupBoot()
 
@@ -37,11 +168,43 @@ class Lcd(Frame):
         self.columnconfigure(0, weight=1)
         self.columnconfigure(1, weight=2)
         self.columnconfigure(2, weight=1)
-        # the scrolling informative "boot" text
-        self._lscroll = Label(self, bg="black", fg="white", font=("Courier New", 14), text="", justify=LEFT)
+        # the scrolling informative "boot" text (a read-only text widget, so that the animation can append to it)
+        self._lscroll = Text(self, bg="black", fg="white", font=("Courier New", 14), borderwidth=0, highlightthickness=0, wrap=NONE, width=1, height=1, state=DISABLED)
         self._lscroll.grid(row=0, column=0, columnspan=3, sticky=W)
         self.pack(fill=BOTH, expand=True)
 
+    # renders the boot text all at once (e.g., for a new round, or to show why the bomb failed to start)
+    def showBootText(self, text):
+        self._clearBootText(text)
+        self._lscroll.configure(state=NORMAL)
+        self._lscroll.insert(END, text)
+        self._lscroll.configure(state=DISABLED)
+
+    # clears the boot text and sizes its widget to fit a text (only internally called)
+    def _clearBootText(self, text):
+        lines = text.split("\n")
+        self._lscroll.configure(width=max(1, max([ len(line) for line in lines ])), height=len(lines), state=NORMAL)
+        self._lscroll.delete("1.0", END)
+        self._lscroll.configure(state=DISABLED)
+
+    # renders the boot text (animated unless animate is False; a key press skips the animation) and then calls done
+    def boot(self, text, done, animate=True):
+        # unbind the key press once the text is rendered
+        def booted():
+            self.winfo_toplevel().unbind("<Key>")
+            done()
+
+        self._boot = BootRenderer(self._lscroll, text, booted)
+        if (animate):
+            # the widget starts empty (sized for the whole text)
+            self._clearBootText(text.replace("\x00", ""))
+            self.winfo_toplevel().bind("<Key>", lambda event: self._boot.skip())
+            self._boot.start()
+        # render the entire text at once
+        else:
+            self.showBootText(text.replace("\x00", ""))
+            done()
+
     # sets up the LCD GUI
     def setup(self):
         # the timer
@@ -70,6 +233,39 @@ class Lcd(Frame):
             self._bquit = tkinter.Button(self, bg="red", fg="white", font=("Courier New", 18), text="Quit", anchor=CENTER, command=self.quit)
             self._bquit.grid(row=6, column=2, pady=40)
 
+    # renders the options (e.g., text, fg) of a widget that changed
+    def render(self, widget, **options):
+        return self._view.render(widget, **options)
+
+    # renders a label of the GUI
+    def showLabel(self, name, text=None, color=None):
+        label = { "timer": self._ltimer, "keypad": self._lkeypad, "wires": self._lwires, "button": self._lbutton, "toggles": self._ltoggles, "strikes": self._lstrikes }[name]
+        options = {}
+        if (text is not None):
+            options["text"] = text
+        if (color is not None):
+            options["fg"] = color
+        rendered = self.render(label, **options)
+        # trace the event that is being handled: the label is updated now, and displayed when Tk is idle again (only if
+        #  the label was actually redrawn)
+        trace = tracer.current
+        if (trace and rendered):
+            tracer.mark(trace, "rendered")
+            self.after_idle(tracer.mark, trace, "displayed")
+
+    # plays a sound
+    def playSound(self, name, loop=False, ambience=False):
+        if (loop):
+            self._sounds.loop(name)
+        elif (ambience):
+            self._sounds.play_ambience(name)
+        else:
+            self._sounds.play(name)
+
+    # renders the conclusion GUI after a delay (ms)
+    def conclude(self, exploding, success, delay):
+        self.after(delay, self.conclusion, exploding, success)
+
     # lets us pause/unpause the timer (7-segment display)
     def setTimer(self, timer):
         self._timer = timer
@@ -78,17 +274,30 @@ class Lcd(Frame):
     def setButton(self, button):
         self._button = button
 
+    # lets us play the conclusion sounds
+    def setSounds(self, sounds):
+        self._sounds = sounds
+
+    # lets us start a new round when retrying
+    def setReset(self, reset):
+        self._reset = reset
+
     # pauses the timer
     def pause(self):
-        if (RPi):
+        if (self._timer):
             self._timer.pause()
 
     # setup the conclusion GUI (explosion/defusion)
     def conclusion(self, exploding=False, success=False):
-        while (not exploding and pygame.mixer.music.get_busy()):
-            sleep(0.1)
+        # let the last sound finish (without blocking the GUI): check again when it is due to end
+        if (not exploding and self._sounds.busy()):
+            self.after(max(FRAME_INTERVAL, int(self._sounds.remaining() * 1000)), self.conclusion, exploding, success)
+            return
+        if (DEBUG):
+            print(f"Label redraws: {self._view._redraws} ({self._view._skipped} skipped)")
         # destroy/clear widgets that are no longer needed
-        self._lscroll["text"] = ""
+        self._view.forget()
+        self._lscroll.grid_remove()
         self._ltimer.destroy()
         self._lkeypad.destroy()
         self._lwires.destroy()
@@ -105,9 +314,9 @@ class Lcd(Frame):
             image = PhotoImage(file=SUCCESS[0])
         else:
             image = PhotoImage(file=EXPLODE[0])
-        self._lscroll["image"] = image
-        self._lscroll.image = image
-        self._lscroll.grid(row=0, column=0, columnspan=3, sticky=EW)
+        self._limage = Label(self, bg="black", image=image)
+        self._limage.image = image
+        self._limage.grid(row=0, column=0, columnspan=3, sticky=EW)
         # the retry button
         self._bretry = tkinter.Button(self, bg="red", fg="white", font=("Courier New", 18), text="Retry", anchor=CENTER, command=self.retry)
         self._bretry.grid(row=1, column=0, pady=40)
@@ -115,25 +324,38 @@ class Lcd(Frame):
         self._bquit = tkinter.Button(self, bg="red", fg="white", font=("Courier New", 18), text="Quit", anchor=CENTER, command=self.quit)
         self._bquit.grid(row=1, column=2, pady=40)
         # play the appropriate (success/explode) audio
+        self._sounds.stop()
         if (success):
-            pygame.mixer.music.load(SUCCESS[1])
+            self._sounds.play(SUCCESS[1])
         else:
-            pygame.mixer.music.load(EXPLODE[1])
-        pygame.mixer.music.play(1)
+            self._sounds.play(EXPLODE[1])
 
     # re-attempts the bomb (after an explosion or a successful defusion)
     def retry(self):
+        # start a new round in this process
+        if (self._reset):
+            self._reset()
+            return
         # re-launch the program (and exit this one)
         os.execv(sys.executable, ["python3"] + [sys.argv[0]])
         exit(0)
 
+    # resets the conclusion GUI back to the "boot" GUI (for a new round)
+    def reset(self):
+        self._bretry.destroy()
+        self._bquit.destroy()
+        # remove the conclusion image (and bring back the boot text)
+        self._limage.destroy()
+        self._lscroll.grid()
+
     # quits the GUI, resetting some components
     def quit(self):
-        if (RPi):
+        if (self._timer):
             # turn off the 7-segment display
-            self._timer._running = False
+            self._timer.stop()
             self._timer._component.blink_rate = 0
             self._timer._component.fill(0)
+        if (self._button):
             # turn off the pushbutton's LED
             for pin in self._button._rgb:
                 pin.value = True
@@ -141,6 +363,8 @@ class Lcd(Frame):
         exit(0)
 
 # template (superclass) for various bomb components/phases
+# a phase reads its component (_read) and then applies what it read to its state (_transition); the phase can either
+#  run in its own thread or be driven (along with the other phases) by the PhaseScanner
 class PhaseThread(Thread):
     def __init__(self, name, component=None, target=None):
         super().__init__(name=name, daemon=True)
@@ -156,67 +380,190 @@ class PhaseThread(Thread):
         self._value = None
         # phase threads are either running or not
         self._running = False
+        # phases send events (e.g., value changed, defused, failed) to the GUI
+        self._events = phase_events
+        # when the input that caused the next event happened (None -> when it is sent), so that its latency can be traced
+        self._origin = None
+        # called when a watched input of the phase changes, so that a runtime polling the phase reads it right away
+        self._wake = None
+        # set when the phase is stopped (so that a phase thread polling its component doesn't wait for the next poll)
+        self._stopped = Event()
+
+    # stops the phase
+    def stop(self):
+        self._running = False
+        self._stopped.set()
+
+    # polls the component until the phase is stopped: more often right after it changes, and less often when it is idle
+    #  (e.g., for a phase thread whose pins aren't watched)
+    def _poll(self):
+        rate = self._polling()
+        last = None
+        while (self._running):
+            state, timestamp = self._read(), monotonic()
+            self._transition(state, timestamp)
+            if (state != last):
+                rate.activity(timestamp)
+            last = state
+            self._stopped.wait(rate.next(timestamp))
+
+    # prepares the phase before its component is first read
+    def _begin(self):
+        self._running = True
+        # let the GUI display the initial value
+        self._notify(EVENT_VALUE)
+
+    # sends an event about the phase
+    def _notify(self, kind):
+        if (self._events):
+            self._events.put(kind, self, self._value, self._origin)
+
+    # notes that the phase is defused
+    def _defuse(self):
+        if (not self._defused):
+            self._defused = True
+            self._notify(EVENT_DEFUSED)
+
+    # notes that the phase failed (every failure is sent as its own event so that no strike is lost)
+    def _fail(self):
+        self._failed = True
+        self._notify(EVENT_FAILED)
+
+    # returns the GPIO pins that the phase reads (so that a scanner can read them all at once)
+    def _pins(self):
+        return []
+
+    # returns how often a runtime (e.g., the scanner) polls the phase: fast right after it changes, and slower when idle
+    def _polling(self, fast=POLL_FAST, slow=POLL_SLOW):
+        return AdaptiveRate(fast, slow)
+
+    # returns the current state of the component (from a snapshot of the pins, if there is one)
+    def _read(self, snapshot=None):
+        return None
+
+    # applies a state of the component (read at the specified time) to the phase
+    def _transition(self, state, timestamp):
+        pass
 
 # template (superclass) for various numeric bomb components/phases
-# these types of phases can be represented as the binary representation of an integer
+# these types of phases can be represented as the binary representation of an integer (the first pin is the most
+#  significant bit)
 # e.g., jumper wires phase, toggle switches phase
 class NumericPhase(PhaseThread):
-    def __init__(self, name, component=None, target=None, display_length=0):
+    def __init__(self, name, component=None, target=None, display_length=0, watch=True, debounce=DEBOUNCE):
         super().__init__(name, component, target)
+        # the pins are debounced by an edge watcher (created when the phase begins) under every runtime, so that a
+        #  bouncing contact is never read as a change (not watched -> the pins are read as they are, e.g., in virtual time)
+        self._watch = watch
+        self._watcher = None
+        # the last state (bitmask) of the component that was read (shared by the checks and the GUI)
+        self._state = self._read()
         # the default value is the current state of the component
-        self._value = self._get_int_state()
+        self._value = self._state
         # we need to know the previous state to detect state change
         self._prev_value = self._value
         # we need to know the display length (character width) of the pin states (for the GUI)
         self._display_length = display_length
+        # the debounce window of the pins (seconds; either one for all pins or one per pin)
+        self._debounce = debounce
+        # the most recent pin transition (with its timestamp)
+        self._last_edge = None
 
     # runs the thread
     def run(self):
-        self._running = True
+        self._begin()
+        # the pins aren't watched -> poll them
+        if (not self._watcher):
+            self._poll()
+            return
+        state = self._read()
         while (self._running):
-            # get the component value
-            self._value = self._get_int_state()
-            # the component value is correct -> phase defused
-            if (self._value == self._target):
-                self._defused = True
-            # the component state has changed
-            elif (self._value != self._prev_value):
-                # one or more component states are incorrect -> phase failed (strike)
-                if (not self._check_state()):
-                    self._failed = True
-                # note the updated state
-                self._prev_value = self._value
-            sleep(0.1)
+            self._transition(state, monotonic())
+            # block until a pin changes (waking up periodically to notice when the phase is stopped)
+            state = self._watched(0.5)
+        self._watcher.close()
+
+    # stops the phase (and releases its pins right away so that a new phase can watch them)
+    def stop(self):
+        super().stop()
+        if (self._watcher):
+            self._watcher.close()
+
+    # starts watching the pins
+    def _begin(self):
+        if (self._watch):
+            self._watcher = EdgeWatcher(self._component, self._debounce, self._wake)
+        super()._begin()
+
+    # returns the GPIO pins that the phase reads from a snapshot (none if they are watched, since a snapshot of the
+    #  levels isn't debounced)
+    def _pins(self):
+        return ([] if self._watch else self._component)
+
+    # returns how often a runtime polls the phase (watched pins wake the runtime when they change, so an idle phase is
+    #  only polled now and then)
+    def _polling(self, fast=POLL_FAST, slow=POLL_SLOW):
+        return AdaptiveRate(fast, POLL_WATCHED if self._watch else slow)
+
+    # returns the (debounced) state of the component as a bitmask
+    # unwatched pins are each read once (unless there is a snapshot of the pins)
+    def _read(self, snapshot=None):
+        if (self._watcher):
+            return self._watched(0)
+        if (snapshot):
+            return snapshot.mask(self._component)
+        state = 0
+        for pin in self._component:
+            state = (state << 1) | pin.value
+        return state
+
+    # returns the state of the watched pins after their transitions, blocking until a pin changes (or the timeout
+    #  expires) (only internally called)
+    def _watched(self, timeout):
+        edges = self._watcher.wait(timeout)
+        if (edges):
+            self._last_edge = edges[-1]
+        return self._watcher.mask
+
+    # applies a state of the component to the phase
+    def _transition(self, state, timestamp):
+        self._state = state
+        if (state != self._value):
+            self._value = state
+            # the change is traced from the pin's transition (if it was caught by the watcher), not from when it was read
+            self._origin = (self._last_edge.timestamp if self._last_edge else timestamp)
+            self._notify(EVENT_VALUE)
+        # the component value is correct -> phase defused
+        if (self._value == self._target):
+            self._defuse()
+        # the component state has changed
+        elif (self._value != self._prev_value):
+            # one or more component states are incorrect -> phase failed (strike)
+            if (not self._check_state()):
+                self._fail()
+            # note the updated state
+            self._prev_value = self._value
 
     # checks the component for an incorrect state (only internally called)
+    # the states are the debounced ones from _read() (a bouncing contact would otherwise look like a change back to an
+    #  invalid state)
     def _check_state(self):
-        # get a list (True/False) of the current, previous, and valid (target) component states
-        states = self._get_bool_state()
-        prev_states = [ bool(int(c)) for c in bin(self._prev_value)[2:].zfill(self._display_length) ]
-        valid_states = [ bool(int(c)) for c in bin(self._target)[2:].zfill(self._display_length) ]
-        # go through each component state
-        for i in range(len(states)):
-            # a component state has changed *and* it is in an invalid state -> phase failed (strike)
-            if (states[i] != prev_states[i] and states[i] != valid_states[i]):
-                return False
-        return True
-
-    # returns the state of the component as a list (True/False)
-    def _get_bool_state(self):
-        return [ pin.value for pin in self._component ]
-
-    # returns the state of the component as an integer
-    def _get_int_state(self):
-        return int("".join([ str(int(n)) for n in self._get_bool_state() ]), 2)
+        # the component states that have changed, and the ones that are in an invalid state
+        changed = self._value ^ self._prev_value
+        invalid = self._value ^ self._target
+        # a component state has changed *and* it is in an invalid state -> phase failed (strike)
+        return (not (changed & invalid))
 
     # returns the state of the component as a string
     def __str__(self):
         if (self._defused):
             return "DEFUSED"
         else:
-            return "".join([chr(int(i)+65) if pin.value == 0 else "." for i, pin in enumerate(self._component) ])
+            # the letters of the pins that are off (from the last state that was read)
+            return "".join([ chr(i + 65) if not (self._state >> (len(self._component) - 1 - i)) & 1 else "." for i in range(len(self._component)) ])
 
 # the timer phase
+# the timer counts down from monotonic deadlines (rather than sleeping after the work of each tick), so it doesn't drift
 class Timer(PhaseThread):
     def __init__(self, component, initial_value, name="Timer"):
         super().__init__(name, component)
@@ -229,23 +576,121 @@ class Timer(PhaseThread):
         self._sec = ""
         # by default, each tick is 1 second
         self._interval = 1
+        # when the current tick ends (None until the timer starts and while it is paused)
+        self._due = None
+        # the fraction of the current tick that was left when the timer was paused
+        self._left = None
+        # guards the deadline (and lets the timer thread wake up early when the interval changes or it is paused)
+        self._cond = Condition()
 
     # runs the thread
     def run(self):
+        self._begin()
+        with self._cond:
+            while (self._running):
+                self._transition(None, monotonic())
+                # wait until the current tick ends (or the timer is paused/unpaused or its interval changes)
+                # a paused timer just waits to be unpaused (or stopped)
+                if (self._running):
+                    self._cond.wait(None if self._paused else max(0, self._due - monotonic()))
+
+    # starts the timer (the GUI is told about its value when it first ticks)
+    def _begin(self):
         self._running = True
-        while (self._running):
-            if (not self._paused):
-                # update the timer and display its value on the 7-segment display
-                self._update()
-                self._component.print(str(self))
-                # wait 1s (default) and continue
-                sleep(self._interval)
+
+    # returns how often a runtime polls the timer (the runtime wakes up when each tick is due, and when the timer is
+    #  paused or its interval changes, so an idle timer is only polled now and then)
+    def _polling(self, fast=POLL_FAST, slow=POLL_SLOW):
+        return AdaptiveRate(fast, POLL_WATCHED)
+
+    # counts down (called by the timer thread or by the runtime driving the phases)
+    def _transition(self, state, timestamp):
+        with self._cond:
+            # a paused timer keeps the part of the current tick that was left
+            if (self._paused):
+                if (self._due is not None):
+                    self._left = max(0, self._due - timestamp) / self._interval
+                    self._due = None
+                return
+            # the timer is starting (the first tick is displayed immediately) or resuming
+            if (self._due is None):
+                if (self._left is None):
+                    self._origin = timestamp
+                    self._update()
+                    self._component.print(str(self))
+                    self._notify(EVENT_TICK)
+                    self._left = 1
+                self._due = timestamp + self._left * self._interval
+                self._left = None
+                return
+            # the current tick hasn't ended yet
+            if (timestamp < self._due):
+                return
+            # one or more ticks have ended (the next deadline is based on the last one so that errors don't accumulate)
+            while (timestamp >= self._due):
+                # the tick's latency is traced from when it was due
+                self._origin = self._due
                 # the timer has expired -> phase failed (explode)
                 if (self._value == 0):
                     self._running = False
+                    self._value -= 1
+                    self._notify(EVENT_TICK)
+                    return
                 self._value -= 1
+                self._due += self._interval
+            # update the timer and display its value on the 7-segment display
+            self._update()
+            self._component.print(str(self))
+            self._notify(EVENT_TICK)
+
+    # stops the timer (waking up the timer thread)
+    def stop(self):
+        with self._cond:
+            super().stop()
+            self._cond.notify_all()
+
+    # changes the length of a tick (the current tick is rescaled so that it ends on time at the new rate)
+    def set_interval(self, interval, timestamp=None):
+        with self._cond:
+            if (interval == self._interval):
+                return
+            if (self._due is not None):
+                now = (monotonic() if timestamp is None else timestamp)
+                self._due = now + max(0, self._due - now) / self._interval * interval
+            self._interval = interval
+            self._cond.notify_all()
+        # a runtime driving the timer must notice the new deadline
+        if (self._wake):
+            self._wake()
+
+    # returns the time left on the countdown (seconds at the current rate) before the timer expires
+    def remaining(self, timestamp=None):
+        with self._cond:
+            # the fraction of the current tick that is left
+            if (self._due is not None):
+                left = max(0, self._due - (monotonic() if timestamp is None else timestamp)) / self._interval
             else:
-                sleep(0.1)
+                left = (1 if self._left is None else self._left)
+            return max(0, self._value + left) * self._interval
+
+    # returns what the timer displays at an instant (which may be between the ticks that the timer thread has done)
+    def reading(self, timestamp=None):
+        with self._cond:
+            now = (monotonic() if timestamp is None else timestamp)
+            # the timer isn't counting (it hasn't started or it is paused) -> the display doesn't change
+            if (self._due is None):
+                left = (1 if self._left is None else self._left) * self._interval
+                return TimerReading(self._value, self._margin(left))
+            # the number of ticks from the current one to the instant (negative if the instant is before the current tick)
+            ticks = floor((now - self._due) / self._interval) + 1
+            # how long until the tick displayed at the instant ends
+            left = self._due + ticks * self._interval - now
+            return TimerReading(max(-1, self._value - ticks), self._margin(left))
+
+    # returns how far an instant is from the nearest tick, given how long until the next tick (only internally called)
+    def _margin(self, left):
+        elapsed = self._interval - left
+        return (left if left <= elapsed else -elapsed)
 
     # updates the timer (only internally called)
     def _update(self):
@@ -254,8 +699,14 @@ class Timer(PhaseThread):
 
     # pauses and unpauses the timer
     def pause(self):
-        # toggle the paused state
-        self._paused = not self._paused
+        with self._cond:
+            # toggle the paused state
+            self._paused = not self._paused
+            # keep (or restore) the part of the current tick that is left
+            self._transition(None, monotonic())
+            self._cond.notify_all()
+        if (self._wake):
+            self._wake()
         # blink the 7-segment display when paused
         self._component.blink_rate = (2 if self._paused else 0)
 
@@ -265,34 +716,76 @@ class Timer(PhaseThread):
 
 # the keypad phase
 class Keypad(PhaseThread):
-    def __init__(self, component, target, name="Keypad"):
+    def __init__(self, component, target, scan_rate=KEYPAD_SCAN_RATE, debounce=KEYPAD_DEBOUNCE, name="Keypad"):
         super().__init__(name, component, target)
         # the default value is an empty string
         self._value = ""
-
-    # runs the thread
+        # how often the keypad thread scans the keypad (Hz; None -> whenever the phase reads it) and the debounce window of
+        #  each key (when a runtime drives the phase, the keypad is scanned whenever the runtime reads it)
+        self._scan_rate = scan_rate
+        self._debounce = debounce
+        # the keypad scanner (created when the phase begins)
+        self._scanner = None
+        # the keys that are held down and when each was pressed (a key is logged when it is released)
+        self._held = {}
+
+    # runs the thread (the keypad is scanned by its own scanner thread)
     def run(self):
-        self._running = True
+        self._begin(self._scan_rate)
         while (self._running):
-            # process keys when keypad key(s) are pressed
-            if (self._component.pressed_keys):
-                # debounce
-                while (self._component.pressed_keys):
-                    try:
-                        # just grab the first key pressed if more than one were pressed
-                        key = self._component.pressed_keys[0]
-                    except:
-                        key = ""
-                    sleep(0.1)
-                # log the key
-                self._value += str(key)
-                # the combination is correct -> phase defused
-                if (self._value == self._target):
-                    self._defused = True
-                # the combination is incorrect -> phase failed (strike)
-                elif (self._value != self._target[0:len(self._value)]):
-                    self._failed = True
-            sleep(0.1)
+            # block until a key is pressed or released (waking up periodically to notice when the phase is stopped)
+            self._transition(self._scanner.wait(0.5), monotonic())
+
+    # stops the phase (and the keypad scanner)
+    def stop(self):
+        super().stop()
+        if (self._scanner):
+            self._scanner.close()
+
+    # starts scanning the keypad (at a scan rate, by the scanner's own thread; or with no scan rate, whenever it is read)
+    # a key press on an idle keypad wakes a runtime that polls the phase
+    def _begin(self, scan_rate=None):
+        self._scanner = KeyScanner(self._component, scan_rate, self._debounce, notify=self._wake)
+        super()._begin()
+
+    # returns how often a runtime polls the keypad: at its scan rate while it is used (so that a quick key tap isn't
+    #  missed between polls), and only now and then when it is idle if a key press wakes the runtime
+    def _polling(self, fast=POLL_FAST, slow=POLL_SLOW):
+        idle = (POLL_WATCHED if KeyScanner.watchable(self._component) else 1 / KEYPAD_IDLE_SCAN_RATE)
+        return AdaptiveRate(1 / (self._scan_rate or KEYPAD_SCAN_RATE), idle)
+
+    # returns the key presses and releases since the last read (the keypad is a matrix, so it isn't in the snapshot of
+    #  the pins)
+    def _read(self, snapshot=None):
+        return self._scanner.events()
+
+    # applies the key presses and releases (in order) to the phase
+    def _transition(self, state, timestamp):
+        for event in state:
+            # the phase was defused by an earlier key
+            if (self._defused):
+                break
+            # keep track of the key while it is held down
+            if (event.pressed):
+                self._held[event.key] = event.timestamp
+            # the key was released -> log it
+            elif (self._held.pop(event.key, None) is not None):
+                self._origin = event.timestamp
+                self._log(event.key)
+
+    # logs a key (only internally called)
+    def _log(self, key):
+        self._value += str(key)
+        self._notify(EVENT_VALUE)
+        # the combination is correct -> phase defused
+        if (self._value == self._target):
+            self._defuse()
+        # the combination is incorrect -> phase failed (strike)
+        elif (self._value != self._target[0:len(self._value)]):
+            # reset the keypad (and forget the keys that are held down, so they aren't logged after the reset)
+            self._value = ""
+            self._held.clear()
+            self._fail()
 
     # returns the keypad combination as a string
     def __str__(self):
@@ -303,8 +796,8 @@ class Keypad(PhaseThread):
 
 # the jumper wires phase
 class Wires(NumericPhase):
-    def __init__(self, component, target, display_length, name="Wires"):
-        super().__init__(name, component, target, display_length)
+    def __init__(self, component, target, display_length, watch=True, debounce=DEBOUNCE, name="Wires"):
+        super().__init__(name, component, target, display_length, watch, debounce)
 
     # returns the jumper wires state as a string
     def __str__(self):
@@ -315,7 +808,7 @@ class Wires(NumericPhase):
 
 # the pushbutton phase
 class Button(PhaseThread):
-    def __init__(self, component_state, component_rgb, target, color, timer, name="Button"):
+    def __init__(self, component_state, component_rgb, target, color, timer, watch=True, debounce=DEBOUNCE, name="Button"):
         super().__init__(name, component_state, target)
         # the default value is False/Released
         self._value = False
@@ -327,35 +820,90 @@ class Button(PhaseThread):
         self._color = color
         # we need to know about the timer (7-segment display) to be able to determine correct pushbutton releases in some cases
         self._timer = timer
+        # the pushbutton's edges are caught (with the time each happened) by an edge watcher, so that a release is judged
+        #  at the instant it happened rather than when it was next read (not watched -> the edges happen when read)
+        self._watch = watch
+        self._debounce = debounce
+        self._watcher = None
+        # the last release of the pushbutton (and how it was judged)
+        self._release = None
 
     # runs the thread
     def run(self):
-        self._running = True
-        # set the RGB LED color
+        self._begin()
+        # the pushbutton isn't watched -> poll it
+        if (not self._watcher):
+            self._poll()
+            return
+        while (self._running):
+            # block until the pushbutton changes (waking up periodically to notice when the phase is stopped)
+            self._transition([ (edge.value, edge.timestamp) for edge in self._watcher.wait(0.5) ], monotonic())
+        self._watcher.close()
+
+    # stops the phase (and releases its pin)
+    def stop(self):
+        super().stop()
+        if (self._watcher):
+            self._watcher.close()
+
+    # sets the RGB LED color (and starts watching the pushbutton)
+    def _begin(self):
+        if (self._watch):
+            self._watcher = EdgeWatcher([ self._component ], self._debounce, self._wake)
+        super()._begin()
         self._rgb[0].value = False if self._color == "R" else True
         self._rgb[1].value = False if self._color == "G" else True
         self._rgb[2].value = False if self._color == "B" else True
-        while (self._running):
-            # get the pushbutton's state
-            self._value = self._component.value
+
+    # returns the GPIO pins that the phase reads from a snapshot (only the state, and only if it isn't watched; the RGB
+    #  pins are outputs)
+    def _pins(self):
+        return ([] if self._watch else [ self._component ])
+
+    # returns how often a runtime polls the phase (a watched pushbutton wakes the runtime when it changes, so an idle
+    #  pushbutton is only polled now and then)
+    def _polling(self, fast=POLL_FAST, slow=POLL_SLOW):
+        return AdaptiveRate(fast, POLL_WATCHED if self._watch else slow)
+
+    # returns the pushbutton's edges since the last read: (value, when it happened or None if it happened when read)
+    def _read(self, snapshot=None):
+        if (self._watcher):
+            return [ (edge.value, edge.timestamp) for edge in self._watcher.wait(0) ]
+        value = (snapshot.value(self._component) if snapshot else self._component.value)
+        return ([ (value, None) ] if value != self._value else [])
+
+    # applies the pushbutton's edges (in order) to the phase
+    def _transition(self, state, timestamp):
+        for value, edge_timestamp in state:
+            self._value = value
+            self._origin = (timestamp if edge_timestamp is None else edge_timestamp)
+            self._notify(EVENT_VALUE)
             # it is pressed
             if (self._value):
                 # note it
                 self._pressed = True
-            # it is released
-            else:
-                # was it previously pressed?
-                if (self._pressed):
-                    # check the release parameters
-                    # for R, nothing else is needed
-                    # for G or B, a specific digit must be in the timer (sec) when released
-                    if (not self._target or self._target in self._timer._sec):
-                        self._defused = True
-                    else:
-                        self._failed = True
-                    # note that the pushbutton was released
-                    self._pressed = False
-            sleep(0.1)
+            # it is released (and it was previously pressed)
+            elif (self._pressed):
+                # check the release at the instant it happened
+                self._judge(self._origin)
+                # note that the pushbutton was released
+                self._pressed = False
+
+    # checks a release of the pushbutton (only internally called)
+    def _judge(self, timestamp):
+        # what the timer displayed when the pushbutton was released
+        reading = self._timer.reading(timestamp)
+        # check the release parameters
+        # for R, nothing else is needed
+        # for G or B, a specific digit must be in the timer (sec) when released
+        success = (not self._target or self._target in f"{reading.value % 60}".zfill(2))
+        self._release = ButtonRelease(timestamp, reading, success)
+        if (DEBUG):
+            print(f"Button released at {reading.value // 60:02}:{reading.value % 60:02} ({reading.margin:+.3f}s from a tick): {'success' if success else 'strike'}")
+        if (success):
+            self._defuse()
+        else:
+            self._fail()
 
     # returns the pushbutton's state as a string
     def __str__(self):
@@ -366,11 +914,86 @@ class Button(PhaseThread):
 
 # the toggle switches phase
 class Toggles(NumericPhase):
-    def __init__(self, component, target, display_length, name="Toggles"):
-        super().__init__(name, component, target, display_length)
-        
-        def __str__(self):
-            if self._defused:
-                return "DEFUSED"
-            else:
-                return "".join([chr(int(i) + 65) if pin.value == 0 else "." for i, pin in enumerate(self._component)])
+    def __init__(self, component, target, display_length, watch=True, debounce=DEBOUNCE, name="Toggles"):
+        super().__init__(name, component, target, display_length, watch, debounce)
+
+# scans every phase from a single thread (instead of running one thread per phase)
+# each pass reads the GPIO pins of the unwatched phases at once into an immutable snapshot (so that those phases all
+#  see the same levels and each pin is only read once per pass) and then applies the states to the phases that
+#  are due; watched phases (the default) read their debounced edges instead; phases that are stopped (e.g., defused) are
+#  skipped
+# each phase is polled at its own adaptive rate: fast right after it changes, and backing off (up to a bound) when it is
+#  idle; the timer is also scanned as soon as its next tick is due, and the watched phases wake the scanner as soon as
+#  one of their pins changes (as do a key press on an idle keypad and pausing the timer), so the idle rate only bounds
+#  how long a change that wasn't caught can wait
+class PhaseScanner(Thread):
+    def __init__(self, phases, fast=POLL_FAST, slow=POLL_SLOW, name="PhaseScanner"):
+        super().__init__(name=name, daemon=True)
+        # the phases to scan
+        self._phases = list(phases)
+        # how often each phase is scanned, and when each phase is next due (phases that are due within the fast interval
+        #  are scanned together, so that the scanner wakes up less often)
+        self._fast = fast
+        self._rates = { phase: phase._polling(fast, slow) for phase in self._phases }
+        self._due = { phase: 0 for phase in self._phases }
+        # reads the pins of every phase at once
+        self._reader = PinReader([ pin for phase in self._phases for pin in phase._pins() ])
+        # the last state read from each phase (phase name -> state)
+        self._states = {}
+        # the number of scans done
+        self._scans = 0
+        # the watched phases wake the scanner up when their pins change
+        self._cond = Condition()
+        self._woken = False
+        for phase in self._phases:
+            phase._wake = self.wake
+        # the scanner is either running or not
+        self._running = False
+
+    # runs the thread
+    def run(self):
+        self._running = True
+        for phase in self._phases:
+            phase._begin()
+        while (self._running):
+            # stop once every phase has stopped
+            phases = [ phase for phase in self._phases if phase._running ]
+            if (not phases):
+                self._running = False
+                break
+            # the scanner was woken up by a pin change -> scan every phase
+            with self._cond:
+                woken, self._woken = self._woken, False
+            # read every pin...
+            snapshot = self._reader.read()
+            timestamp = snapshot.timestamp
+            # ...and the components of the phases that are due (from the snapshot)...
+            phases = [ phase for phase in phases if woken or self._due[phase] <= timestamp + self._fast or self._ticking(phase, timestamp) ]
+            states = [ phase._read(snapshot) for phase in phases ]
+            # ...and then apply the states
+            for phase, state in zip(phases, states):
+                phase._transition(state, timestamp)
+                # the phase changed -> scan it more often
+                rate = self._rates[phase]
+                if (state != self._states.get(phase.name)):
+                    rate.activity(timestamp)
+                self._due[phase] = timestamp + rate.next(timestamp)
+                self._states[phase.name] = state
+            self._scans += 1
+            # sleep until the next phase (or timer tick) is due, or a pin changes
+            due = [ self._due[phase] for phase in self._phases if phase._running ]
+            due += [ phase._due for phase in self._phases if phase._running and getattr(phase, "_due", None) is not None ]
+            with self._cond:
+                if (due and not self._woken):
+                    self._cond.wait(max(0, min(due) - monotonic()))
+
+    # wakes the scanner up (e.g., when a watched pin changes) so that the phases are scanned right away
+    def wake(self):
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+
+    # is the phase a timer whose next tick is due? (only internally called)
+    def _ticking(self, phase, timestamp):
+        due = getattr(phase, "_due", None)
+        return (due is not None and due <= timestamp)
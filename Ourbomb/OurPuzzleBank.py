@@ -0,0 +1,104 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Puzzle bank (pre-generated puzzles)
+# Team: Gourd
+#################################
+
+# imports
+from struct import Struct
+from random import randrange
+import mmap
+import sys
+
+# the bank's header: a magic number and the number of puzzles in the bank
+BANK_HEADER = Struct("<8sI")
+BANK_MAGIC = b"GOURDPZ1"
+# a puzzle's record (fixed width, so that the puzzle of a seed is at a known offset in the bank)
+#  serial, toggles target, wires target, keyword, cipher keyword, rot, keypad target, passphrase, button color, button target
+#  the strings are padded with NULs (and an empty button target is None)
+PUZZLE_RECORD = Struct("<8sBB6s6sB5s5s1s1s")
+
+###########
+# functions
+###########
+# packs a puzzle (the tuple returned by genPuzzle()) into a record
+def packPuzzle(puzzle):
+    serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target = puzzle
+    return PUZZLE_RECORD.pack(serial.encode(), toggles_target, wires_target, keyword.encode(), cipher_keyword.encode(), rot,
+                              keypad_target.encode(), passphrase.encode(), button_color.encode(), (button_target or "").encode())
+
+# unpacks a record into a puzzle (the tuple returned by genPuzzle())
+def unpackPuzzle(record, offset=0):
+    serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target = PUZZLE_RECORD.unpack_from(record, offset)
+    return (_text(serial), toggles_target, wires_target, _text(keyword), _text(cipher_keyword), rot, _text(keypad_target), _text(passphrase),
+            _text(button_color), (_text(button_target) or None))
+
+# decodes a NUL padded string field (only internally called)
+def _text(field):
+    return field.rstrip(b"\x00").decode()
+
+# generates a bank of puzzles (the puzzle of seed n is the bank's nth record)
+def buildBank(path, count):
+    # the generators are only needed to build a bank (not to read one)
+    from OUrConfigs import genSerials, genKeypadCombinations, genButton
+
+    serials = genSerials(count)
+    combinations = genKeypadCombinations(count)
+    with open(path, "wb") as file:
+        file.write(BANK_HEADER.pack(BANK_MAGIC, count))
+        for (serial, toggles_target, wires_target), (keyword, cipher_keyword, rot, keypad_target, passphrase) in zip(serials, combinations):
+            button_color, button_target = genButton(serial)
+            file.write(packPuzzle((serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target)))
+
+# returns the puzzle of a seed from a bank (a random puzzle if there's no seed)
+# the banks stay open (mapped), so that a new round only reads one more record
+def loadPuzzle(path, seed=None):
+    bank = _banks.get(path)
+    if (bank is None):
+        bank = _banks[path] = PuzzleBank(path)
+    if (seed is None):
+        seed = randrange(len(bank))
+    return bank[seed]
+
+#########
+# classes
+#########
+# a bank of pre-generated puzzles in a memory-mapped file (a header followed by fixed-width records)
+# a bomb boots by reading one record, and a seed always gives the same puzzle (e.g., for reruns and tournaments)
+class PuzzleBank:
+    def __init__(self, path):
+        self._path = path
+        # map the file (only the records that are read are paged in)
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = BANK_HEADER.unpack_from(self._map, 0)
+        if (magic != BANK_MAGIC or len(self._map) < BANK_HEADER.size + self._count * PUZZLE_RECORD.size):
+            self._map.close()
+            raise ValueError(f"{path} isn't a puzzle bank")
+
+    # the number of puzzles in the bank
+    def __len__(self):
+        return self._count
+
+    # returns the puzzle of a seed (the tuple returned by genPuzzle())
+    def __getitem__(self, seed):
+        if (not 0 <= seed < self._count):
+            raise IndexError(f"{self._path} has no puzzle {seed} (it has {self._count})")
+        return unpackPuzzle(self._map, BANK_HEADER.size + seed * PUZZLE_RECORD.size)
+
+    # unmaps the file
+    def close(self):
+        self._map.close()
+
+# the banks that are open (by path)
+_banks = {}
+
+######
+# MAIN
+######
+# builds a bank, e.g., python3 OurPuzzleBank.py puzzles.bin 10000
+if (__name__ == "__main__"):
+    if (len(sys.argv) != 3):
+        print(f"usage: {sys.argv[0]} bank count")
+        sys.exit(1)
+    buildBank(sys.argv[1], int(sys.argv[2]))
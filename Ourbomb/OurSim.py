@@ -0,0 +1,183 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Simulated hardware (in-memory components)
+# Team: Gourd
+#################################
+
+# imports
+from threading import Thread, Lock
+from time import monotonic, sleep
+
+#########
+# classes
+#########
+# a simulated GPIO pin (the same surface as digitalio.DigitalInOut)
+class FakePin:
+    def __init__(self, value=False, name=""):
+        # the pin's name (e.g., D14)
+        self._name = name
+        self._value = value
+        # the pin's direction and pull (not simulated, just remembered)
+        self.direction = None
+        self.pull = None
+        # callbacks that are called (with the pin) when the pin's value changes
+        self._listeners = []
+
+    # the pin's value
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        changed = (value != self._value)
+        self._value = value
+        if (changed):
+            for listener in list(self._listeners):
+                listener(self)
+
+    # calls the callback (with the pin) whenever the pin's value changes
+    def watch(self, callback):
+        self._listeners.append(callback)
+
+    # stops calling the callback
+    def unwatch(self, callback):
+        if (callback in self._listeners):
+            self._listeners.remove(callback)
+
+    def __repr__(self):
+        return f"FakePin({self._name}={self._value})"
+
+# a simulated keypad matrix (the same surface as adafruit_matrixkeypad.Matrix_Keypad)
+class FakeKeypad:
+    def __init__(self, keys=((1, 2, 3), (4, 5, 6), (7, 8, 9), ("*", 0, "#"))):
+        # the keys (rows of columns)
+        self.keys = keys
+        # the keys that are held down (in the order they were pressed)
+        self._pressed = []
+        self._lock = Lock()
+        # callbacks that are called (with the keypad) whenever a key is pressed or released
+        self._listeners = []
+
+    # the keys that are held down
+    @property
+    def pressed_keys(self):
+        with self._lock:
+            return list(self._pressed)
+
+    # holds a key down
+    def press(self, key):
+        with self._lock:
+            changed = (key not in self._pressed)
+            if (changed):
+                self._pressed.append(key)
+        if (changed):
+            self._changed()
+
+    # releases a key
+    def release(self, key):
+        with self._lock:
+            changed = (key in self._pressed)
+            if (changed):
+                self._pressed.remove(key)
+        if (changed):
+            self._changed()
+
+    # calls the callback (with the keypad) whenever a key is pressed or released
+    def watch(self, callback):
+        self._listeners.append(callback)
+
+    # stops calling the callback
+    def unwatch(self, callback):
+        if (callback in self._listeners):
+            self._listeners.remove(callback)
+
+    # calls the callbacks (only internally called)
+    def _changed(self):
+        for listener in list(self._listeners):
+            listener(self)
+
+# a simulated 7-segment display (the same surface as adafruit_ht16k33.segments.Seg7x4)
+class FakeSeg7x4:
+    def __init__(self, i2c=None):
+        self.brightness = 1.0
+        self.blink_rate = 0
+        self.auto_write = True
+        self.colon = False
+        # the raw segments of each digit
+        self._digits = [ 0 ] * 4
+        # the text that was last printed (None if raw segments were set)
+        self._text = None
+        # the number of times the buffer was written to the "display"
+        self._shows = 0
+
+    # prints text to the display
+    def print(self, value):
+        self._text = str(value)
+        if (self.auto_write):
+            self.show()
+
+    # sets the raw segments of a digit
+    def set_digit_raw(self, index, bitmask):
+        self._digits[index] = bitmask
+        self._text = None
+        if (self.auto_write):
+            self.show()
+
+    # fills the display (e.g., fill(0) turns it off)
+    def fill(self, color):
+        self._digits = [ (0x7F if color else 0) ] * 4
+        self._text = None
+        self.colon = bool(color)
+        if (self.auto_write):
+            self.show()
+
+    # writes the buffer to the "display"
+    def show(self):
+        self._shows += 1
+
+# drives the simulated components from a script (so that whole games can be played without a human)
+# the script is a list of steps: (seconds after the script starts, function, arguments...)
+#  e.g., [ (0.5, keypad.press, 1), (0.6, keypad.release, 1), (1.0, setattr, wires[0], "value", False) ]
+class ScriptedInput(Thread):
+    def __init__(self, steps, name="ScriptedInput"):
+        super().__init__(name=name, daemon=True)
+        # the steps (in order)
+        self._steps = sorted(steps, key=lambda step: step[0])
+        # the number of steps done
+        self._done = 0
+        self._running = False
+
+    # runs the thread
+    def run(self):
+        self._running = True
+        start = monotonic()
+        for step in self._steps:
+            if (not self._running):
+                break
+            # wait until the step is due
+            delay = start + step[0] - monotonic()
+            if (delay > 0):
+                sleep(delay)
+            step[1](*step[2:])
+            self._done += 1
+        self._running = False
+
+    # builds the steps that type keys on a keypad (each key is held for the specified time)
+    @staticmethod
+    def typing(keypad, keys, start=0, gap=0.2, hold=0.05):
+        steps = []
+        for i, key in enumerate(keys):
+            key = (int(key) if str(key).isdigit() else key)
+            steps.append((start + i * gap, keypad.press, key))
+            steps.append((start + i * gap + hold, keypad.release, key))
+        return steps
+
+    # builds the steps that set pins to the bits of a value (the leftmost pin is the most significant bit)
+    @staticmethod
+    def setting(pins, value, start=0, gap=0.2):
+        steps = []
+        for i, pin in enumerate(pins):
+            bit = bool((value >> (len(pins) - 1 - i)) & 1)
+            steps.append((start + i * gap, setattr, pin, "value", bit))
+        return steps
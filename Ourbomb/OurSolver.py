@@ -0,0 +1,103 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Solver (derives and checks the defuse actions of a puzzle)
+# Team: Gourd
+#################################
+
+# import the configs (the keypad tables, the manual's keywords, and the bootup text)
+from OUrConfigs import KEYWORDS, KEYPAD_TABLE, ROT_TABLES, genBootText
+# import the puzzle bank
+from OurPuzzleBank import PuzzleBank
+# other imports
+from collections import namedtuple
+from multiprocessing import Pool
+from time import perf_counter
+from string import ascii_uppercase, digits
+import re
+import sys
+
+# the keyword line of the bootup text, e.g., "*Keyword: ORNALN; key: 9"
+KEYWORD_LINE = re.compile(r"\*Keyword: ([A-Z]+); key: (\d+)")
+# the manual's lookup table: keyword -> (passphrase, combination)
+MANUAL = { keyword: (passphrase, passphrase.translate(KEYPAD_TABLE)) for keyword, passphrase in KEYWORDS.items() }
+# keeps only the digits of a serial number
+SERIAL_DIGITS = str.maketrans("", "", ascii_uppercase)
+# keeps only the toggle letters (A..D) of a serial number, and the toggle switch (bit) of each
+SERIAL_TOGGLES = str.maketrans("", "", ascii_uppercase[4:] + digits)
+TOGGLE_BITS = { "A": 8, "B": 4, "C": 2, "D": 1 }
+# how many puzzles each worker validates at a time
+SOLVER_CHUNK = 10000
+
+# the defuse actions of a puzzle
+#  toggles: the toggle switches that must be on (A is the most significant bit)
+#  wires: the jumper wires that must be connected (A is the most significant bit)
+#  keypad: the combination that must be typed
+#  button: the digit that must be on the timer when the pushbutton is released (None -> release it any time)
+Solution = namedtuple("Solution", ["toggles", "wires", "keypad", "button"])
+
+###########
+# functions
+###########
+# derives the defuse actions from what the player sees: the bootup text, the serial number, and the pushbutton's color
+def solve(boot_text, serial, button_color):
+    # keypad: decrypt the keyword (the bootup text has the key), then look up its passphrase in the manual
+    cipher_keyword, rot = KEYWORD_LINE.search(boot_text).groups()
+    keyword = cipher_keyword.translate(ROT_TABLES[-int(rot)])
+    passphrase, keypad = MANUAL[keyword]
+    # wires: the sum of the serial number's digits
+    #  the wires target isn't changed by the pushbutton's color (the G/B rewrite in genButton() is commented out)
+    serial_digits = serial.translate(SERIAL_DIGITS)
+    wires = sum(map(int, serial_digits))
+    # toggles: the serial number's letters A..D
+    toggles = sum([ TOGGLE_BITS[c] for c in serial.translate(SERIAL_TOGGLES) ])
+    # button: R -> any time; G -> the first digit of the serial number; B -> the last digit of the serial number
+    button = None
+    if (button_color == "G"):
+        button = serial_digits[0]
+    elif (button_color == "B"):
+        button = serial_digits[-1]
+
+    return Solution(toggles, wires, keypad, button)
+
+# checks that the derived actions defuse a puzzle (the tuple returned by genPuzzle())
+def validate(puzzle):
+    serial, toggles_target, wires_target, keyword, cipher_keyword, rot, keypad_target, passphrase, button_color, button_target = puzzle
+    solution = solve(genBootText(serial, cipher_keyword, rot), serial, button_color)
+    return (solution == (toggles_target, wires_target, keypad_target, button_target))
+
+# validates the puzzles of a bank (optionally across a pool of processes)
+# returns the seeds of the puzzles that failed, and the number of puzzles that were validated
+def validateBank(path, processes=1):
+    bank = PuzzleBank(path)
+    count = len(bank)
+    bank.close()
+    chunks = [ (path, start, min(start + SOLVER_CHUNK, count)) for start in range(0, count, SOLVER_CHUNK) ]
+    if (processes > 1):
+        with Pool(processes) as pool:
+            failed = pool.map(_validateChunk, chunks)
+    else:
+        failed = [ _validateChunk(chunk) for chunk in chunks ]
+    return [ seed for seeds in failed for seed in seeds ], count
+
+# validates a chunk (path, start seed, stop seed) of a bank (only internally called, possibly by a worker process)
+def _validateChunk(chunk):
+    path, start, stop = chunk
+    bank = PuzzleBank(path)
+    failed = [ seed for seed in range(start, stop) if not validate(bank[seed]) ]
+    bank.close()
+    return failed
+
+######
+# MAIN
+######
+# validates a bank, e.g., python3 OurSolver.py puzzles.bin 4
+if (__name__ == "__main__"):
+    if (len(sys.argv) not in (2, 3)):
+        print(f"usage: {sys.argv[0]} bank [processes]")
+        sys.exit(1)
+    started = perf_counter()
+    failed, count = validateBank(sys.argv[1], int(sys.argv[2]) if len(sys.argv) == 3 else 1)
+    elapsed = perf_counter() - started
+    print(f"{count} puzzles validated in {elapsed:.2f}s ({count / elapsed:.0f}/s); {len(failed)} failed")
+    if (failed):
+        print(f"Failed seeds: {failed[:20]}")
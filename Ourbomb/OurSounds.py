@@ -0,0 +1,69 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Sound bank
+# Team: Gourd
+#################################
+
+# imports
+from time import monotonic
+
+###########
+# functions
+###########
+# initializes the audio (pygame is only imported when the audio is initialized, so that the GUI can appear first)
+def initAudio(buffer):
+    import pygame
+    # a small audio buffer makes sounds start playing sooner
+    pygame.mixer.pre_init(buffer=buffer)
+    pygame.mixer.init()
+
+#########
+# classes
+#########
+# the bomb's sounds, decoded once (at boot) so that playing one doesn't re-read/re-decode its file
+# ambience (e.g., the looping tick) and effects (e.g., strikes) have their own channels, so an effect doesn't stop the
+#  ambience
+class SoundBank:
+    def __init__(self, files):
+        import pygame
+        # decode every sound (the file name is the sound's name)
+        self._sounds = { file: pygame.mixer.Sound(file) for file in files }
+        # reserve a channel for the ambience and one for the effects (so that they're never used for anything else)
+        pygame.mixer.set_reserved(2)
+        self._ambience = pygame.mixer.Channel(0)
+        self._effects = pygame.mixer.Channel(1)
+        # when the current effect ends
+        self._effect_end = 0
+
+    # loops a sound on the ambience channel (replacing the current ambience)
+    def loop(self, name):
+        self._ambience.play(self._sounds[name], loops=-1)
+
+    # plays a sound once on the ambience channel (replacing the current ambience)
+    def play_ambience(self, name):
+        self._ambience.play(self._sounds[name])
+
+    # plays a sound on the effects channel (the ambience keeps playing)
+    def play(self, name):
+        self._effects.play(self._sounds[name])
+        self._effect_end = monotonic() + self._sounds[name].get_length()
+
+    # is an effect playing?
+    def busy(self):
+        return self._effects.get_busy()
+
+    # returns how long (seconds) until the current effect ends
+    def remaining(self):
+        if (not self._effects.get_busy()):
+            return 0
+        return max(0, self._effect_end - monotonic())
+
+    # is the ambience playing?
+    def ambience_busy(self):
+        return self._ambience.get_busy()
+
+    # stops every sound
+    def stop(self):
+        self._ambience.stop()
+        self._effects.stop()
+        self._effect_end = 0
@@ -0,0 +1,194 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Latency tracing (input -> display)
+# Team: Gourd
+#################################
+
+# import the configs
+from OUrConfigs import *
+# other imports
+from collections import OrderedDict
+from itertools import count
+from threading import Thread, Lock
+from time import monotonic
+import sys
+
+# the resolution of the histograms: each power of 2 is split into 2^HISTOGRAM_SUB_BITS buckets (i.e., 4 -> the
+#  latencies are within ~6%)
+HISTOGRAM_SUB_BITS = 4
+# the number of traces that are kept open (the oldest are forgotten, e.g., events that were never rendered)
+TRACE_OPEN = 256
+# the stages that a trace goes through (in order)
+#  event: the phase sent the event
+#  handled: the game started handling the event
+#  strike: the event caused a strike
+#  rendered: a label was updated because of the event
+#  displayed: Tk redrew the label (the GUI was idle again)
+TRACE_STAGES = [ "event", "handled", "strike", "rendered", "displayed" ]
+
+#########
+# classes
+#########
+# a log-linear (HDR-style) histogram of latencies: the buckets are linear within each power of 2, so the percentiles have
+#  the same relative error at every scale, and recording a latency is a couple of integer operations
+class LatencyHistogram:
+    def __init__(self, sub_bits=HISTOGRAM_SUB_BITS):
+        # the number of linear buckets in each power of 2
+        self._sub_bits = sub_bits
+        self._sub = 1 << sub_bits
+        # the count of each (non-empty) bucket
+        self._counts = {}
+        self._count = 0
+        # the exact total and maximum (microseconds)
+        self._total = 0
+        self._max = 0
+
+    # records a latency (seconds)
+    def record(self, seconds):
+        us = max(0, int(seconds * 1000000))
+        index = self._index(us)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self._count += 1
+        self._total += us
+        self._max = max(self._max, us)
+
+    # the number of latencies recorded
+    @property
+    def count(self):
+        return self._count
+
+    # returns the latency (seconds) that a fraction (0..1) of the recorded latencies are at or below
+    def percentile(self, fraction):
+        if (not self._count):
+            return 0
+        rank = max(1, round(fraction * self._count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if (seen >= rank):
+                return min(self._value(index), self._max) / 1000000
+        return self._max / 1000000
+
+    # returns a summary of the histogram (milliseconds)
+    def summary(self):
+        return { "count": self._count,
+                 "mean_ms": round(self._total / max(1, self._count) / 1000, 3),
+                 "p50_ms": round(self.percentile(0.5) * 1000, 3),
+                 "p95_ms": round(self.percentile(0.95) * 1000, 3),
+                 "p99_ms": round(self.percentile(0.99) * 1000, 3),
+                 "max_ms": round(self._max / 1000, 3) }
+
+    # returns the bucket of a latency (microseconds) (only internally called)
+    # the first 2 * sub buckets are exact; after that, each power of 2 has sub buckets
+    def _index(self, us):
+        if (us < 2 * self._sub):
+            return us
+        shift = us.bit_length() - (self._sub_bits + 1)
+        return (shift + 1) * self._sub + (us >> shift) - self._sub
+
+    # returns the (middle) latency (microseconds) of a bucket (only internally called)
+    def _value(self, index):
+        if (index < 2 * self._sub):
+            return index
+        shift = index // self._sub - 1
+        top = index % self._sub + self._sub
+        return (top << shift) + (1 << shift) // 2
+
+# traces the phases' inputs through the game to the GUI
+# a trace starts when a phase sends an event (from the input that caused it, e.g., the edge of a pin); the event carries
+#  the trace's ID through the game logic and the label update, and each stage records its latency (since the input) in
+#  the phase's histograms
+class Tracer:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        # the next trace ID
+        self._ids = count(1)
+        # the open traces: ID -> (phase name, when the input happened, the stages already recorded)
+        self._traces = OrderedDict()
+        # the histograms: (phase name, stage) -> histogram
+        self._histograms = {}
+        # the trace of the event that is being handled (on the GUI's thread)
+        self.current = None
+        # the phases' threads start traces while the GUI's thread records them
+        self._lock = Lock()
+        # the local endpoint (if it is being served)
+        self._server = None
+
+    # starts a trace for an event sent by a phase (the input happened at origin) and returns its ID (None if disabled)
+    def start(self, phase, origin=None, timestamp=None):
+        if (not self.enabled):
+            return None
+        now = (monotonic() if timestamp is None else timestamp)
+        with self._lock:
+            trace = next(self._ids)
+            self._traces[trace] = (phase, (now if origin is None else origin), set())
+            # forget the oldest trace
+            if (len(self._traces) > TRACE_OPEN):
+                self._traces.popitem(last=False)
+        self.mark(trace, "event", now)
+        return trace
+
+    # records that a trace reached a stage (only the first time)
+    def mark(self, trace, stage, timestamp=None):
+        if (trace is None):
+            return
+        now = (monotonic() if timestamp is None else timestamp)
+        with self._lock:
+            if (trace not in self._traces):
+                return
+            phase, origin, stages = self._traces[trace]
+            if (stage in stages):
+                return
+            stages.add(stage)
+            key = (phase, stage)
+            if (key not in self._histograms):
+                self._histograms[key] = LatencyHistogram()
+            self._histograms[key].record(now - origin)
+
+    # notes that the event of a trace is being handled (the stages that follow are recorded against it)
+    def handle(self, trace):
+        self.current = trace
+        self.mark(trace, "handled")
+
+    # returns the summaries of the histograms: phase name -> stage -> summary
+    def report(self):
+        with self._lock:
+            report = {}
+            for (phase, stage), histogram in sorted(self._histograms.items(), key=lambda item: (item[0][0], TRACE_STAGES.index(item[0][1]))):
+                report.setdefault(phase, {})[stage] = histogram.summary()
+            return report
+
+    # prints the summaries of the histograms
+    def dump(self, file=sys.stdout):
+        print("Latency (since the input, ms):", file=file)
+        for phase, stages in self.report().items():
+            for stage, summary in stages.items():
+                print(f"  {phase:<8} {stage:<9} n={summary['count']:<5} p50={summary['p50_ms']:<8} p95={summary['p95_ms']:<8} "
+                      f"p99={summary['p99_ms']:<8} max={summary['max_ms']}", file=file)
+
+    # serves the summaries (as JSON) from a local endpoint, e.g., http://127.0.0.1:8102/
+    # (the HTTP server is only imported if the endpoint is served, so the bomb doesn't load it at startup)
+    def serve(self, port):
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        import json
+        tracer = self
+
+        # answers every GET with the report
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(tracer.report(), indent=2).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            # don't log every request
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        Thread(name="TraceServer", target=self._server.serve_forever, daemon=True).start()
+
+# the tracer of the bomb's phases
+tracer = Tracer(TRACE)
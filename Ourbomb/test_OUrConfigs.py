@@ -0,0 +1,30 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Tests of the puzzle generation (run with: python -m pytest Ourbomb)
+# Team: Gourd
+#################################
+
+# import the configs
+from OUrConfigs import *
+# other imports
+from collections import Counter
+from itertools import product
+from math import sqrt
+import random
+
+###########
+# functions
+###########
+# the digits drawn for a total are drawn uniformly from every sequence of digits that adds up to it
+def test_sample_digits_is_uniform():
+    random.seed(102)
+    for total, count in ((5, 3), (20, 3), (14, 4)):
+        sequences = [ digits for digits in product(range(10), repeat=count) if sum(digits) == total ]
+        assert DIGIT_SUMS[count][total] == len(sequences)
+        samples = Counter([ tuple(sampleDigits(total, count)) for i in range(200 * len(sequences)) ])
+        # only (and every one of) the sequences that add up to the total are drawn...
+        assert set(samples) == set(sequences)
+        # ...and about as often as each other (a chi-squared test, well within 6 standard deviations)
+        chi2 = sum([ (samples[digits] - 200) ** 2 / 200 for digits in sequences ])
+        df = len(sequences) - 1
+        assert chi2 < df + 6 * sqrt(2 * df)
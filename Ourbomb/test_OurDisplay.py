@@ -0,0 +1,54 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Tests of the 7-segment display driver (run with: python -m pytest Ourbomb)
+# Team: Gourd
+#################################
+
+# import the 7-segment display driver
+from OurDisplay import *
+# import the simulated components
+from OurSim import FakeSeg7x4
+
+###########
+# functions
+###########
+# a mm:ss value is written from its precomputed segments in a single show(), and only when it changes
+def test_segment_display_skips_identical_writes():
+    seg = FakeSeg7x4()
+    display = SegmentDisplay(seg)
+    assert not seg.auto_write
+    display.print("01:30")
+    assert seg._digits == [ 0x3F, 0x06, 0x4F, 0x3F ]
+    assert seg.colon
+    assert seg._shows == 1
+    display.print("01:30")
+    assert seg._shows == 1
+    display.print("01:29")
+    assert seg._shows == 2
+    assert (display._writes, display._skipped) == (2, 1)
+
+# text that isn't a mm:ss value is rendered by the display, and turning the display off is only written once
+def test_segment_display_text_and_fill():
+    seg = FakeSeg7x4()
+    display = SegmentDisplay(seg)
+    display.print("boom")
+    assert seg._text == "boom"
+    display.fill(0)
+    display.fill(0)
+    assert seg._digits == [ 0 ] * 4
+    assert seg._shows == 2
+    # redisplaying the text after a fill writes it again
+    display.print("boom")
+    assert seg._shows == 3
+
+# the blink rate and brightness are only written when they change
+def test_segment_display_settings():
+    seg = FakeSeg7x4()
+    display = SegmentDisplay(seg)
+    display.blink_rate = 2
+    display.blink_rate = 2
+    display.brightness = 0.5
+    display.brightness = 0.5
+    display.blink_rate = 0
+    assert (seg.blink_rate, seg.brightness) == (0, 0.5)
+    assert (display._writes, display._skipped) == (3, 2)
@@ -0,0 +1,104 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Tests of the phase events (run with: python -m pytest Ourbomb)
+# Team: Gourd
+#################################
+
+# import the phase events
+from OurEvents import *
+# other imports
+from threading import Thread
+from pytest import raises
+import os
+
+#########
+# classes
+#########
+# a phase that only has a name
+class NamedPhase:
+    def __init__(self, name):
+        self.name = name
+
+# a widget whose Tk can't watch a pipe (so the queue is polled), and that records what is scheduled
+class PollingWidget:
+    def __init__(self):
+        self.tk = None
+        self.scheduled = []
+        self.idle = []
+
+    def after(self, ms, callback):
+        self.scheduled.append((ms, callback))
+        return len(self.scheduled)
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def after_cancel(self, id):
+        self.scheduled[id - 1] = None
+
+# the Tk of a widget that watches the pipe
+class WatchingTk:
+    def __init__(self):
+        self.handlers = {}
+
+    def createfilehandler(self, fd, mask, callback):
+        self.handlers[fd] = callback
+
+    def deletefilehandler(self, fd):
+        del self.handlers[fd]
+
+###########
+# functions
+###########
+# every event sent by several threads is kept (in the order each thread sent them), and draining the queue empties the
+#  pipe that wakes up the main loop
+def test_event_queue_keeps_every_event():
+    queue = EventQueue()
+    phases = [ NamedPhase(f"phase{i}") for i in range(4) ]
+    senders = [ Thread(target=lambda phase=phase: [ queue.put(EVENT_FAILED, phase, i) for i in range(500) ]) for phase in phases ]
+    for sender in senders:
+        sender.start()
+    for sender in senders:
+        sender.join()
+    events = queue.get_all()
+    assert len(events) == 2000
+    for phase in phases:
+        assert [ event.value for event in events if event.phase is phase ] == list(range(500))
+    with raises(BlockingIOError):
+        os.read(queue._read_fd, 1)
+    assert queue.get_all() == []
+
+# Tk watches the pipe: the events are delivered when it is readable, and not after the queue is detached
+def test_event_queue_watches_the_pipe():
+    queue = EventQueue()
+    widget = PollingWidget()
+    widget.tk = WatchingTk()
+    handled = []
+    queue.attach(widget, handled.append)
+    queue.put(EVENT_VALUE, NamedPhase("Wires"), 3)
+    widget.tk.handlers[queue._read_fd](queue._read_fd, tkinter.READABLE)
+    assert [ (event.kind, event.phase.name, event.value) for event in handled ] == [ (EVENT_VALUE, "Wires", 3) ]
+    queue.detach()
+    assert widget.tk.handlers == {}
+
+# Tk can't watch the pipe: the queue is polled, the events sent before it was attached are delivered, and a handler
+#  that detaches the queue stops the delivery
+def test_event_queue_polls_without_a_pipe():
+    queue = EventQueue()
+    widget = PollingWidget()
+    phase = NamedPhase("Keypad")
+    queue.put(EVENT_VALUE, phase, "1")
+    queue.put(EVENT_DEFUSED, phase, "12")
+    queue.put(EVENT_VALUE, phase, "12")
+    handled = []
+
+    def handler(event):
+        handled.append(event.kind)
+        if (event.kind == EVENT_DEFUSED):
+            queue.detach()
+
+    queue.attach(widget, handler)
+    assert widget.scheduled[0][0] == EVENT_POLL_INTERVAL
+    widget.idle.pop()()
+    assert handled == [ EVENT_VALUE, EVENT_DEFUSED ]
+    assert widget.scheduled == [ None ]
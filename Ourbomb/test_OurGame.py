@@ -0,0 +1,35 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Tests of the game logic (run with: python -m pytest Ourbomb)
+# Team: Gourd
+#################################
+
+# import the configs
+from OUrConfigs import *
+# import the game logic
+from OurGame import *
+# import the simulated components
+from OurSim import ScriptedInput
+
+###########
+# functions
+###########
+# the game: a puzzle is defused headless (in virtual time) with the solver's actions
+def test_headless_game_is_defused():
+    game = simulatedGame(0b1110, 0b00011, "1234", "R", None)
+    steps = ScriptedInput.typing(game._keypad._component, "1234", start=1)
+    steps += ScriptedInput.setting(game._wires._component, 0b00011, start=3)
+    steps += ScriptedInput.setting(game._toggles._component, 0b1110, start=5)
+    steps += [ (7, setattr, game._button._component, "value", True), (7.5, setattr, game._button._component, "value", False) ]
+    assert game.run(steps) is True
+    assert game._strikes_left == NUM_STRIKES
+
+# the game: the bomb explodes when the countdown expires
+def test_headless_game_explodes():
+    game = simulatedGame(0b1110, 0b00011, "1234", "R", None, countdown=5)
+    assert game.run() is False
+
+# the game: a countdown longer than the default one still runs until the bomb explodes
+def test_headless_game_runs_its_own_countdown():
+    game = simulatedGame(0b1110, 0b00011, "1234", "R", None, countdown=COUNTDOWN * 3)
+    assert game.run() is False
@@ -0,0 +1,151 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Tests of the input engine (run with: python -m pytest Ourbomb)
+# Team: Gourd
+#################################
+
+# import the input engine
+from OurInputs import *
+# import the simulated components
+from OurSim import FakeKeypad
+# other imports
+from threading import enumerate as threads, Event
+from time import sleep
+
+#########
+# classes
+#########
+# a pin that can't be watched (so its watcher has to sample it)
+class PlainPin:
+    def __init__(self, value=False):
+        self.value = value
+
+# a keypad matrix that is scanned like adafruit_matrixkeypad.Matrix_Keypad (a row is driven low, and the columns of its
+#  pressed keys read low)
+class MatrixKeypad:
+    def __init__(self, keys=((1, 2), (3, 4))):
+        self.keys = keys
+        self.down = set()
+        self._row_pins = [ RowPin() for row in keys ]
+        self._col_pins = [ ColPin(self, col) for col in range(len(keys[0])) ]
+
+    @property
+    def pressed_keys(self):
+        for pin in self._row_pins:
+            pin.driven = False
+        pressed = []
+        for row, pin in enumerate(self._row_pins):
+            pin.switch_to_output(value=False)
+            pressed += [ self.keys[row][col] for col, col_pin in enumerate(self._col_pins) if not col_pin.value ]
+            pin.driven = False
+        return pressed
+
+# a row pin of the keypad matrix
+class RowPin:
+    def __init__(self):
+        self.driven = False
+
+    def switch_to_output(self, value):
+        self.driven = not value
+
+# a column pin of the keypad matrix (pulled up)
+class ColPin:
+    def __init__(self, keypad, col):
+        self._keypad = keypad
+        self._col = col
+
+    @property
+    def value(self):
+        return not any([ pin.driven and row[self._col] in self._keypad.down for pin, row in zip(self._keypad._row_pins, self._keypad.keys) ])
+
+###########
+# functions
+###########
+# a scan that could hold a ghost is ignored until a key is released
+def test_keypad_ghosting():
+    keypad = FakeKeypad()
+    scanner = KeyScanner(keypad, rate=None, debounce=0)
+    for key in (1, 2, 4):
+        keypad.press(key)
+    scanner.scan()
+    assert scanner.held == (1, 2, 4)
+    # 1, 2, 4 and 5 are the corners of a rectangle -> 5 could be a ghost
+    keypad.press(5)
+    assert not scanner.scan()
+    assert scanner.held == (1, 2, 4)
+    assert scanner._ghosts == 1
+    # a corner is released -> the scans are decoded again
+    keypad.release(1)
+    scanner.scan()
+    assert scanner.held == (2, 4, 5)
+
+# keys held down together are reported as a chord once they are all released
+def test_keypad_chords():
+    keypad = FakeKeypad()
+    scanner = KeyScanner(keypad, rate=None, debounce=0)
+    keypad.press(1)
+    keypad.press(5)
+    scanner.scan(0)
+    keypad.release(1)
+    scanner.scan(1)
+    assert scanner.chords() == []
+    keypad.release(5)
+    scanner.scan(2)
+    assert scanner.chords() == [ KeyChord((1, 5), 2) ]
+    # every press and release was buffered (the releases before the presses)
+    assert [ (event.key, event.pressed) for event in scanner.events() ] == [ (1, True), (5, True), (1, False), (5, False) ]
+
+# the pins of every watcher without edge detection are sampled by a single thread (which ends with the last watcher)
+def test_edge_watchers_share_a_sampler():
+    watchers = [ EdgeWatcher([ PlainPin(), PlainPin() ], 0.01) for i in range(3) ]
+    assert [ thread.name for thread in threads() ].count("PinSampler") == 1
+    watchers[1]._pins[0].value = True
+    assert [ (edge.index, edge.value) for edge in watchers[1].wait(1) ] == [ (0, True) ]
+    for watcher in watchers:
+        watcher.close()
+    sleep(EDGE_SAMPLE_INTERVAL * 3)
+    assert "PinSampler" not in [ thread.name for thread in threads() ]
+
+# an idle keypad isn't scanned: the first key press wakes the scanner
+def test_idle_keypad_wakes_the_scanner():
+    keypad = FakeKeypad()
+    woken = Event()
+    scanner = KeyScanner(keypad, debounce=0, notify=woken.set)
+    sleep(0.05)
+    scans = scanner._scans
+    sleep(0.2)
+    assert scanner._scans == scans
+    keypad.press(7)
+    assert woken.wait(1)
+    assert [ (event.key, event.pressed) for event in scanner.wait(1) ] == [ (7, True) ]
+    scanner.close()
+
+# an idle keypad matrix has every row driven low, so a key press pulls a column low (which wakes whoever polls it)
+def test_idle_matrix_is_armed():
+    keypad = MatrixKeypad()
+    woken = Event()
+    scanner = KeyScanner(keypad, rate=None, debounce=0, notify=woken.set)
+    assert not scanner.scan()
+    assert all([ pin.driven for pin in keypad._row_pins ])
+    # only the columns are read until a key is pressed
+    assert not scanner.scan()
+    assert scanner._scans == 1
+    keypad.down.add(4)
+    assert woken.wait(1)
+    assert scanner.scan()
+    assert scanner.held == (4,)
+    assert not any([ pin.driven for pin in keypad._row_pins ])
+    scanner.close()
+
+# a poll waits the fast interval while there was recent activity, then backs off (by a factor per poll) to the slow one
+def test_adaptive_rate_backs_off():
+    rate = AdaptiveRate(fast=0.01, slow=0.1, hold=1, backoff=2)
+    rate.activity(0)
+    assert rate.next(0.5) == 0.01
+    assert [ rate.next(1 + i) for i in range(5) ] == [ 0.02, 0.04, 0.08, 0.1, 0.1 ]
+    # activity brings the fast interval back right away
+    rate.activity(10)
+    assert rate.interval == 0.01
+    assert rate.next(10) == 0.01
+    # the slow interval is never faster than the fast one
+    assert AdaptiveRate(fast=0.5, slow=0.1).next(100) == 0.5
@@ -0,0 +1,226 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Tests of the phases (run with: python -m pytest Ourbomb)
+# Team: Gourd
+#################################
+
+# import the configs
+from OUrConfigs import *
+# import the phases
+from OurPhases import *
+# import the simulated components
+from OurSim import FakePin, FakeKeypad, FakeSeg7x4, ScriptedInput
+# other imports
+from pytest import approx
+from time import sleep
+import OurPhases
+
+#########
+# classes
+#########
+# collects the events that a phase sends (instead of the GUI's event queue)
+class EventSink:
+    def __init__(self):
+        self.kinds = []
+
+    def put(self, kind, phase, value=None, origin=None):
+        self.kinds.append(kind)
+
+# a widget that records how it is configured
+class FakeLabel:
+    def __init__(self):
+        self.configured = []
+
+    def configure(self, **options):
+        self.configured.append(options)
+
+# a read-only text widget that records what is inserted into it and what is scheduled (the test runs the callbacks)
+class FakeText:
+    def __init__(self):
+        self.state = DISABLED
+        self.inserts = []
+        self.scheduled = {}
+        self._ids = 0
+
+    def configure(self, state):
+        self.state = state
+
+    def insert(self, index, chars):
+        assert (self.state == NORMAL and index == END)
+        self.inserts.append(chars)
+
+    def after(self, ms, callback):
+        self._ids += 1
+        self.scheduled[self._ids] = (ms, callback)
+        return self._ids
+
+    def after_cancel(self, id):
+        del self.scheduled[id]
+
+    # runs the only callback that is scheduled and returns its delay (ms)
+    def run(self):
+        (id, (ms, callback)), = self.scheduled.items()
+        del self.scheduled[id]
+        callback()
+        return ms
+
+###########
+# functions
+###########
+# returns a phase that sends its events to a sink
+def sunk(phase):
+    phase._events = EventSink()
+    return phase
+
+# a wire that bounces right after a valid cut isn't read as a reconnect (a strike) by the scanner
+def test_scanner_debounces_a_bouncing_wire():
+    pins = [ FakePin(True) for i in range(5) ]
+    wires = sunk(Wires(pins, 0b00011, display_length=5, debounce=0.05))
+    scanner = PhaseScanner([ wires ])
+    scanner.start()
+    sleep(0.1)
+    # cut the first wire, then cut the second one with a 40ms bounce (short reconnections every 3ms), then the third
+    steps = [ (0, setattr, pins[0], "value", False), (0.1, setattr, pins[1], "value", False) ]
+    steps += [ (0.101 + i * 0.001, setattr, pins[1], "value", i % 3 == 2) for i in range(40) ]
+    steps += [ (0.142, setattr, pins[1], "value", False), (0.25, setattr, pins[2], "value", False) ]
+    script = ScriptedInput(steps)
+    script.start()
+    script.join()
+    sleep(0.15)
+    wires.stop()
+    scanner._running = False
+    scanner.join()
+    assert EVENT_FAILED not in wires._events.kinds
+    assert wires._defused
+
+# only a change to an invalid state is a strike
+def test_strike_mask():
+    toggles = sunk(Toggles([ FakePin(False) for i in range(4) ], 0b1010, display_length=4, watch=False))
+    toggles._begin()
+    # a correct switch is flipped on -> no strike
+    toggles._transition(0b1000, 0)
+    assert EVENT_FAILED not in toggles._events.kinds
+    # an incorrect switch is flipped on -> strike
+    toggles._transition(0b1100, 1)
+    assert toggles._events.kinds.count(EVENT_FAILED) == 1
+    # it is flipped back off (a change to a valid state) -> no strike
+    toggles._transition(0b1000, 2)
+    assert toggles._events.kinds.count(EVENT_FAILED) == 1
+    # the correct switches are on -> defused
+    toggles._transition(0b1010, 3)
+    assert toggles._defused
+
+# the keypad phase doesn't start a scanner thread when a runtime drives it
+def test_keypad_scanned_by_the_runtime():
+    keypad = sunk(Keypad(FakeKeypad(), "12"))
+    keypad._begin()
+    assert keypad._scanner._thread is None
+    keypad.stop()
+
+# what the timer displays at an instant between its ticks
+def test_timer_reading():
+    timer = Timer(FakeSeg7x4(), 120)
+    timer._events = None
+    timer._begin()
+    # the first tick is displayed immediately, and the next one is due after 1s
+    timer._transition(None, 0)
+    # (the margin is negative after a tick and positive before the next one)
+    assert timer.reading(0.25) == TimerReading(120, -0.25)
+    assert timer.reading(0.75) == TimerReading(120, 0.25)
+    # 2.25s later (before the timer thread has ticked): 2 ticks have ended
+    assert timer.reading(2.25) == TimerReading(118, -0.25)
+    timer._transition(None, 2.25)
+    assert timer._value == 118
+
+# a paused timer keeps the part of the current tick that was left
+def test_timer_pause():
+    timer = Timer(FakeSeg7x4(), 120)
+    timer._events = None
+    timer._begin()
+    timer._transition(None, 0)
+    timer._paused = True
+    timer._transition(None, 0.4)
+    assert timer._due is None
+    assert timer.remaining(100) == approx(120.6)
+    # it resumes where it left off
+    timer._paused = False
+    timer._transition(None, 100)
+    assert timer._due == approx(100.6)
+    assert timer.reading(101).value == 119
+    assert timer.reading(101).margin == approx(-0.4)
+
+# a phase thread whose pins aren't watched polls them instead
+def test_unwatched_wires_thread():
+    pins = [ FakePin(True) for i in range(5) ]
+    wires = sunk(Wires(pins, 0b01111, display_length=5, watch=False))
+    wires.start()
+    pins[0].value = False
+    sleep(POLL_FAST * 5)
+    assert wires._defused
+    wires.stop()
+    wires.join(1)
+    assert not wires.is_alive()
+
+# an unwatched pushbutton thread polls the pushbutton instead
+def test_unwatched_button_thread():
+    pin = FakePin(False)
+    button = sunk(Button(pin, [ FakePin(True) for i in range(3) ], "", "R", Timer(FakeSeg7x4(), 120), watch=False))
+    button.start()
+    pin.value = True
+    sleep(POLL_FAST * 5)
+    pin.value = False
+    sleep(POLL_FAST * 5)
+    assert button._defused
+    button.stop()
+    button.join(1)
+    assert not button.is_alive()
+
+# the boot text is appended as its characters become due (a late frame catches up in one insert), and each frame is
+#  scheduled for when the next character is due
+def test_boot_renderer_appends_the_characters(monkeypatch):
+    clock = [ 0 ]
+    monkeypatch.setattr(OurPhases, "monotonic", lambda: clock[0])
+    text, done = FakeText(), []
+    boot = BootRenderer(text, "ab\x00cd", lambda: done.append(True))
+    boot.start()
+    assert text.inserts == [ "a" ]
+    clock[0] = 0.03
+    assert text.run() == 25
+    assert text.inserts == [ "a", "b" ]
+    # "c" is due after the pause; the frame is late, so "c" and "d" are inserted together
+    clock[0] = 0.83
+    assert text.run() == 770
+    assert text.inserts == [ "a", "b", "cd" ]
+    assert text.state == DISABLED
+    clock[0] = 0.85
+    assert text.run() == 20
+    assert done == [ True ]
+    assert text.scheduled == {}
+
+# skipping the animation renders the rest of the text at once (and only finishes it once)
+def test_boot_renderer_skip(monkeypatch):
+    monkeypatch.setattr(OurPhases, "monotonic", lambda: 0)
+    text, done = FakeText(), []
+    boot = BootRenderer(text, "ab\x00cd", lambda: done.append(True))
+    boot.skip()
+    assert text.inserts == []
+    boot.start()
+    boot.skip()
+    boot.skip()
+    assert text.inserts == [ "a", "bcd" ]
+    assert done == [ True ]
+    assert text.scheduled == {}
+
+# a widget is only configured with the options that changed, and the redraws and skips are counted
+def test_view_model_skips_unchanged_options():
+    view = ViewModel()
+    timer, wires = FakeLabel(), FakeLabel()
+    assert view.render(timer, text="Time left: 02:00", fg="#00ff00")
+    assert not view.render(timer, text="Time left: 02:00", fg="#00ff00")
+    assert view.render(timer, text="Time left: 01:59", fg="#00ff00")
+    assert view.render(wires, text="Wires phase: 11111")
+    assert timer.configured == [ { "text": "Time left: 02:00", "fg": "#00ff00" }, { "text": "Time left: 01:59" } ]
+    assert (view._redraws, view._skipped) == (3, 1)
+    # once the widgets are forgotten (e.g., destroyed), everything is rendered again
+    view.forget()
+    assert view.render(timer, text="Time left: 01:59")
@@ -0,0 +1,30 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Tests of the puzzle bank and the solver (run with: python -m pytest Ourbomb)
+# Team: Gourd
+#################################
+
+# import the configs
+from OUrConfigs import genPuzzle
+# import the puzzle bank and the solver
+from OurPuzzleBank import packPuzzle, unpackPuzzle, buildBank, PuzzleBank
+from OurSolver import validate, validateBank
+
+###########
+# functions
+###########
+# a puzzle is packed into a record and unpacked unchanged
+def test_puzzle_pack_round_trip():
+    for i in range(100):
+        puzzle = genPuzzle()
+        assert unpackPuzzle(packPuzzle(puzzle)) == puzzle
+
+# every puzzle of a bank is read back and solved
+def test_puzzle_bank_validates(tmp_path):
+    path = str(tmp_path / "puzzles.bin")
+    buildBank(path, 200)
+    bank = PuzzleBank(path)
+    assert len(bank) == 200
+    assert all([ validate(bank[seed]) for seed in range(len(bank)) ])
+    bank.close()
+    assert validateBank(path) == ([], 200)
@@ -0,0 +1,56 @@
+#################################
+# CSC 102 Defuse the Bomb Project
+# Tests of the latency tracing (run with: python -m pytest Ourbomb)
+# Team: Gourd
+#################################
+
+# import the latency tracing
+from OurTrace import *
+# other imports
+from urllib.request import urlopen
+from pytest import approx
+import json
+
+###########
+# functions
+###########
+# small latencies have their own buckets, and larger ones are within a bucket's width (1/16 of their power of 2)
+def test_histogram_buckets():
+    histogram = LatencyHistogram()
+    for us in range(32):
+        assert histogram._value(histogram._index(us)) == us
+    last = 0
+    for us in range(32, 1000000, 997):
+        index = histogram._index(us)
+        assert index >= last
+        assert histogram._value(index) == approx(us, rel=1 / 16)
+        last = index
+
+# the percentiles of 1..1000 ms
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.5) == 0
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+    assert histogram.count == 1000
+    assert histogram.percentile(0.5) == approx(0.5, rel=1 / 16)
+    assert histogram.percentile(0.99) == approx(0.99, rel=1 / 16)
+    # a bucket never reports more than the largest latency
+    assert histogram.percentile(1) <= 1
+    summary = histogram.summary()
+    assert summary["mean_ms"] == 500.5
+    assert summary["max_ms"] == 1000
+
+# a trace records each stage once, against the input that started it, and the report is served as JSON
+def test_tracer_serves_its_report():
+    tracer = Tracer(True)
+    trace = tracer.start("Wires", origin=10, timestamp=10.002)
+    tracer.mark(trace, "rendered", 10.005)
+    tracer.mark(trace, "rendered", 10.5)
+    report = tracer.report()
+    assert report["Wires"]["event"]["max_ms"] == approx(2, abs=0.01)
+    assert report["Wires"]["rendered"]["count"] == 1
+    tracer.serve(0)
+    with urlopen(f"http://127.0.0.1:{tracer._server.server_address[1]}/") as response:
+        assert json.loads(response.read()) == report
+    tracer._server.shutdown()
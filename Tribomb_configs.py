@@ -14,8 +14,46 @@ NUM_STRIKES = 5      # the total strikes allowed before the bomb "explodes"
 NUM_PHASES = 4       # the total number of initial active bomb phases
 
 # imports
-from random import randint, shuffle, choice
+from random import randint, randrange, shuffle, choice, choices
 from string import ascii_uppercase
+from math import ceil
+
+# the serial number tables (precomputed, so that generating a serial number never has to retry)
+#  DIGIT_SUMS[n][s]: the number of ways that n digits (0..9) can add up to s
+DIGIT_SUMS = [ [ 1 ] + [ 0 ] * 27 ]
+for _n in range(3):
+    DIGIT_SUMS.append([ sum(DIGIT_SUMS[_n][s - d] for d in range(min(9, s) + 1)) for s in range(28) ])
+# the jumper wire targets (exactly 3 of the 5 are set)
+WIRES_TARGETS = [ n for n in range(32) if bin(n).count("1") == 3 ]
+# the final letter of a serial number (F..Z)
+SERIAL_LAST_LETTERS = ascii_uppercase[5:]
+
+# the keypad tables (built once, so that a combination is a couple of str.translate() calls)
+#  ROT_TABLES[rot]: encrypts a keyword using a rotation cipher (rot 0..25)
+ROT_TABLES = [ str.maketrans(ascii_uppercase, ascii_uppercase[rot:] + ascii_uppercase[:rot]) for rot in range(26) ]
+# the letters on each key of the keypad (Q and Z aren't on the keypad)
+KEYPAD_LETTERS = [ None, None, "ABC", "DEF", "GHI", "JKL", "MNO", "PRS", "TUV", "WXY" ]
+# maps each letter of a passphrase to its keypad digit (letters that aren't on the keypad are dropped)
+KEYPAD_TABLE = str.maketrans("".join(k for k in KEYPAD_LETTERS if k), "".join(str(i) * len(k) for i, k in enumerate(KEYPAD_LETTERS) if k), "QZ")
+# the keywords (for the keypad lookup table) and matching passphrases
+KEYWORDS = { "BANDIT": "RIVER",\
+             "BUCKLE": "FADED",\
+             "CANOPY": "FOXES",\
+             "DEBATE": "THROW",\
+             "FIERCE": "TRICK",\
+             "GIFTED": "CYCLE",\
+             "IMPACT": "STOLE",\
+             "LONELY": "TOADY",\
+             "MIGHTY": "ALOOF",\
+             "NATURE": "CARVE",\
+             "REBORN": "CLIMB",\
+             "RECALL": "FEIGN",\
+             "SYSTEM": "LEAVE",\
+             "TAKING": "SPINY",\
+             "WIDELY": "BOUND",\
+             "ZAGGED": "YACHT" }
+
+# hardware libraries
 if (RPi):
     import board
     from adafruit_ht16k33.segments import Seg7x4
@@ -94,86 +132,73 @@ if (RPi):
 #  the last letter should be outside of the range
 def genSerial():
     # set the digits (used in the toggle switches phase)
-    serial_digits = []
     toggle_value = randint(1, 15)
     # the sum of the digits is the toggle value
-    while (len(serial_digits) < 3 or toggle_value - sum(serial_digits) > 0):
-        d = randint(0, min(9, toggle_value - sum(serial_digits)))
-        serial_digits.append(d)
+    serial_digits = sampleDigits(toggle_value, serialDigits(toggle_value))
 
     # set the letters (used in the jumper wires phase)
-    jumper_indexes = [ 0 ] * 5
-    while (sum(jumper_indexes) < 3):
-        jumper_indexes[randint(0, len(jumper_indexes) - 1)] = 1
-    jumper_value = int("".join([ str(n) for n in jumper_indexes ]), 2)
-    # the letters indicate which jumper wires must be "cut"
-    jumper_letters = [ chr(i + 65) for i, n in enumerate(jumper_indexes) if n == 1 ]
+    jumper_value = choice(WIRES_TARGETS)
+    # the letters indicate which jumper wires must be set (the most significant bit is A)
+    letters = [ chr(i + 65) for i in range(5) if (jumper_value >> (4 - i)) & 1 ]
 
     # form the serial number
-    serial = [ str(d) for d in serial_digits ] + jumper_letters
+    serial = [ str(d) for d in serial_digits ] + letters
     # and shuffle it
     shuffle(serial)
     # finally, add a final letter (F..Z)
-    serial += [ choice([ chr(n) for n in range(70, 91) ]) ]
+    serial += [ choice(SERIAL_LAST_LETTERS) ]
     # and make the serial number a string
     serial = "".join(serial)
 
     return serial, toggle_value, jumper_value
 
+# generates n serial numbers (and their targets) at once, e.g., to pre-generate the puzzles of a whole event
+# returns a list of (serial, toggle_value, jumper_value)
+def genSerials(n):
+    return [ genSerial() for i in range(n) ]
+
+# the number of digits in a serial number whose digits add up to a total (the fewest digits that can, but at least 3)
+def serialDigits(total):
+    return max(3, ceil(total / 9))
+
+# draws digits that add up to a total, uniformly from every sequence of that many digits that does
+# each digit is weighted by the number of ways that the remaining digits can add up to the rest (so there's no retrying)
+def sampleDigits(total, count):
+    digits = []
+    for n in range(count, 0, -1):
+        r = randrange(DIGIT_SUMS[n][total])
+        for d in range(min(9, total) + 1):
+            r -= DIGIT_SUMS[n - 1][total - d]
+            if (r < 0):
+                break
+        digits.append(d)
+        total -= d
+    return digits
+
 # generates the keypad combination from a keyword and rotation key
 def genKeypadCombination():
-    # encrypts a keyword using a rotation cipher
-    def encrypt(keyword, rot):
-        cipher = ""
-
-        # encrypt each letter of the keyword using rot
-        for c in keyword:
-            cipher += chr((ord(c) - 65 + rot) % 26 + 65)
-
-        return cipher
-
-    # returns the keypad digits that correspond to the passphrase
-    def digits(passphrase):
-        combination = ""
-        keys = [ None, None, "ABC", "DEF", "GHI", "JKL", "MNO", "PRS", "TUV", "WXY" ]
-
-        # process each character of the keyword
-        for c in passphrase:
-            for i, k in enumerate(keys):
-                if (k and c in k):
-                    # map each character to its digit equivalent
-                    combination += str(i)
-
-        return combination
-
-    # the list of keywords and matching passphrases
-    keywords = { "BANDIT": "RIVER",\
-                 "BUCKLE": "FADED",\
-                 "CANOPY": "FOXES",\
-                 "DEBATE": "THROW",\
-                 "FIERCE": "TRICK",\
-                 "GIFTED": "CYCLE",\
-                 "IMPACT": "STOLE",\
-                 "LONELY": "TOADY",\
-                 "MIGHTY": "ALOOF",\
-                 "NATURE": "CARVE",\
-                 "REBORN": "CLIMB",\
-                 "RECALL": "FEIGN",\
-                 "SYSTEM": "LEAVE",\
-                 "TAKING": "SPINY",\
-                 "WIDELY": "BOUND",\
-                 "ZAGGED": "YACHT" }
     # the rotation cipher key
     rot = randint(1, 25)
 
     # pick a keyword and matching passphrase
-    keyword, passphrase = choice(list(keywords.items()))
-    # encrypt the passphrase and get its combination
-    cipher_keyword = encrypt(keyword, rot)
-    combination = digits(passphrase)
+    keyword, passphrase = choice(list(KEYWORDS.items()))
+    # encrypt the keyword and get the passphrase's combination
+    cipher_keyword = keyword.translate(ROT_TABLES[rot])
+    combination = passphrase.translate(KEYPAD_TABLE)
 
     return keyword, cipher_keyword, rot, combination, passphrase
 
+# generates n keypad combinations at once, e.g., to pre-generate the puzzles of a whole event (or to print them)
+# every keyword's combination is only worked out once, and the rotations are looked up in the tables
+# returns a list of (keyword, cipher_keyword, rot, combination, passphrase)
+def genKeypadCombinations(n):
+    keywords = [ (keyword, passphrase, passphrase.translate(KEYPAD_TABLE)) for keyword, passphrase in KEYWORDS.items() ]
+    ciphers = { keyword: [ keyword.translate(table) for table in ROT_TABLES ] for keyword in KEYWORDS }
+    combinations = []
+    for (keyword, passphrase, combination), rot in zip(choices(keywords, k=n), choices(range(1, 26), k=n)):
+        combinations.append((keyword, ciphers[keyword][rot], rot, combination, passphrase))
+    return combinations
+
 ###############################
 # generate the bomb's specifics
 ###############################
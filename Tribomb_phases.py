@@ -201,13 +201,14 @@ class Keypad(PhaseThread):
             # process keys when keypad key(s) are pressed
             if (self._component.pressed_keys):
                 # debounce
-                while (self._component.pressed_keys):
-                    try:
-                        # just grab the first key pressed if more than one were pressed
-                        key = self._component.pressed_keys[0]
-                    except:
-                        key = ""
+                key = ""
+                # read the pressed keys once per pass (the list can empty out between two reads)
+                keys = self._component.pressed_keys
+                while (keys):
+                    # just grab the first key pressed if more than one were pressed
+                    key = keys[0]
                     sleep(0.1)
+                    keys = self._component.pressed_keys
                 # log the key
                 self._value += str(key)
                 # the combination is correct -> phase defused